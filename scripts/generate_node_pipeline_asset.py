@@ -3,20 +3,52 @@
 
 from __future__ import annotations
 
+import io
+import re
+import sys
 from pathlib import Path
+from typing import TextIO
 
 CANVAS_W = 1200
 CANVAS_H = 1400
 
-BG = "#0b1020"
-PANEL = "#10192e"
-PANEL_ALT = "#132244"
-STROKE = "#7dd3fc"
-TEXT = "#e5f3ff"
-MUTED = "#9fb7d5"
+# Interned: these recur in thousands of fragments and as cache/format keys.
+BG = sys.intern("#0b1020")
+PANEL = sys.intern("#10192e")
+PANEL_ALT = sys.intern("#132244")
+STROKE = sys.intern("#7dd3fc")
+TEXT = sys.intern("#e5f3ff")
+MUTED = sys.intern("#9fb7d5")
 
+FONT_MONO = 'font-family="ui-monospace, SFMono-Regular, Menlo, monospace"'
+ANCHOR_MID = 'text-anchor="middle"'
 
-def _box(
+
+_WS_BETWEEN_TAGS = re.compile(r">\s+<")
+
+# Fragment templates are parsed once at import; helpers fill in coordinates.
+_LINE_TMPL = (
+    '<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
+    f'stroke="{STROKE}" stroke-width="{{width}}"/>'
+)
+_ARROW_LINE_TMPL = (
+    '<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
+    f'stroke="{STROKE}" stroke-width="{{width}}" marker-end="url(#arrow)"/>'
+)
+
+
+def _minify(svg: str) -> str:
+    """Collapse inter-element whitespace; attribute values and text stay intact."""
+    return _WS_BETWEEN_TAGS.sub("><", svg).strip() + "\n"
+
+
+def _emit(out: TextIO, fragment: str) -> None:
+    out.write(fragment)
+    out.write("\n")
+
+
+def _box_into(
+    out: TextIO,
     x: int,
     y: int,
     w: int,
@@ -24,48 +56,44 @@ def _box(
     title: str,
     subtitle: str | None = None,
     fill: str = PANEL,
-) -> str:
-    parts = [
-        (
-            f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="14" '
-            f'fill="{fill}" stroke="{STROKE}" stroke-width="2"/>'
-        ),
-        (
-            f'<text x="{x + (w // 2)}" y="{y + 36}" fill="{TEXT}" '
-            'font-family="ui-monospace, SFMono-Regular, Menlo, monospace" '
-            'font-size="24" text-anchor="middle">'
-            f"{title}</text>"
-        ),
-    ]
+) -> None:
+    cx = x + (w // 2)
+    title_y = y + 36
+    subtitle_y = y + 64
+    _emit(
+        out,
+        f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="14" '
+        f'fill="{fill}" stroke="{STROKE}" stroke-width="2"/>'
+    )
+    _emit(
+        out,
+        f'<text x="{cx}" y="{title_y}" fill="{TEXT}" {FONT_MONO} '
+        f'font-size="24" {ANCHOR_MID}>{title}</text>'
+    )
 
     if subtitle:
-        parts.append(
-            (
-                f'<text x="{x + (w // 2)}" y="{y + 64}" fill="{MUTED}" '
-                'font-family="ui-monospace, SFMono-Regular, Menlo, monospace" '
-                'font-size="18" text-anchor="middle">'
-                f"{subtitle}</text>"
-            ),
+        _emit(
+            out,
+            f'<text x="{cx}" y="{subtitle_y}" fill="{MUTED}" {FONT_MONO} '
+            f'font-size="18" {ANCHOR_MID}>{subtitle}</text>'
         )
 
-    return "\n".join(parts)
 
+def _arrow_line_into(out: TextIO, x1: int, y1: int, x2: int, y2: int, width: int = 3) -> None:
+    _emit(out, _ARROW_LINE_TMPL.format(x1=x1, y1=y1, x2=x2, y2=y2, width=width))
 
-def _arrow_line(x1: int, y1: int, x2: int, y2: int, width: int = 3) -> str:
-    return (
-        f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
-        f'stroke="{STROKE}" stroke-width="{width}" marker-end="url(#arrow)"/>'
-    )
 
+def _line_into(out: TextIO, x1: int, y1: int, x2: int, y2: int, width: int = 3) -> None:
+    _emit(out, _LINE_TMPL.format(x1=x1, y1=y1, x2=x2, y2=y2, width=width))
 
-def _line(x1: int, y1: int, x2: int, y2: int, width: int = 3) -> str:
-    return (
-        f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
-        f'stroke="{STROKE}" stroke-width="{width}"/>'
-    )
 
+def _path_into(out: TextIO, segments: list[tuple[int, int, int, int]], width: int = 3) -> None:
+    """Emit several same-styled strokes as one <path> with move-to breaks."""
+    d = " ".join(f"M {x1} {y1} L {x2} {y2}" for x1, y1, x2, y2 in segments)
+    _emit(out, f'<path d="{d}" fill="none" stroke="{STROKE}" stroke-width="{width}"/>')
 
-def build_svg() -> str:
+
+def write_svg(out: TextIO) -> None:
     x_center = CANVAS_W // 2
     stack_x = 320
     stack_w = 560
@@ -94,84 +122,95 @@ def build_svg() -> str:
     dash_w = 360
     dash_h = 86
 
-    parts = [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        (
-            f'<svg xmlns="http://www.w3.org/2000/svg" width="{CANVAS_W}" '
-            f'height="{CANVAS_H}" viewBox="0 0 {CANVAS_W} {CANVAS_H}">'
-        ),
-        "<defs>",
-        (
-            f'<marker id="arrow" markerWidth="12" markerHeight="12" refX="9" refY="6" '
-            'orient="auto"><path d="M0,0 L0,12 L10,6 z" '
-            f'fill="{STROKE}"/></marker>'
-        ),
-        (
-            '<filter id="softShadow" x="-20%" y="-20%" width="140%" height="140%">'
-            '<feDropShadow dx="0" dy="4" stdDeviation="6" flood-color="#020617" '
-            'flood-opacity="0.55"/></filter>'
-        ),
-        "</defs>",
-        f'<rect x="0" y="0" width="{CANVAS_W}" height="{CANVAS_H}" fill="{BG}"/>',
-        (
-            f'<text x="{x_center}" y="58" fill="{TEXT}" '
-            'font-family="ui-monospace, SFMono-Regular, Menlo, monospace" '
-            'font-size="36" text-anchor="middle">'
-            "Senseye Node Pipeline</text>"
-        ),
-        (
-            f'<text x="{x_center}" y="88" fill="{MUTED}" '
-            'font-family="ui-monospace, SFMono-Regular, Menlo, monospace" '
-            'font-size="18" text-anchor="middle">'
-            "scan → filter → infer → share → fuse → render</text>"
-        ),
-        '<g filter="url(#softShadow)">',
-        _box(
-            stack_x,
-            signals_y,
-            stack_w,
-            stack_h,
-            "Signals",
-            "WiFi / BLE / Acoustic",
-            fill=PANEL_ALT,
-        ),
-        _box(stack_x, scan_y, stack_w, stack_h, "Scan"),
-        _box(stack_x, kalman_y, stack_w, stack_h, "Adaptive Kalman", "Per link"),
-        _box(stack_x, infer_y, stack_w, stack_h, "Infer", "Links / Devices / Zones + Confidence"),
-        _box(
-            stack_x,
-            gossip_y,
-            stack_w,
-            stack_h,
-            "Gossip Mesh",
-            "mDNS + TCP, sequence dedup, hop TTL",
-            fill=PANEL_ALT,
-        ),
-        _box(stack_x, consensus_y, stack_w, stack_h, "Consensus Fusion"),
-        _box(trilat_x, branch_y, branch_w, branch_h, "Trilateration"),
-        _box(tomo_x, branch_y, branch_w, branch_h, "Tomography"),
-        _box(world_x, world_y, world_w, world_h, "World State", "Static map + dynamic overlay"),
-        _box(dash_x, dash_y, dash_w, dash_h, "Dashboard", fill=PANEL_ALT),
-        "</g>",
-        # vertical stack arrows
-        _arrow_line(x_center, signals_y + stack_h, x_center, scan_y),
-        _arrow_line(x_center, scan_y + stack_h, x_center, kalman_y),
-        _arrow_line(x_center, kalman_y + stack_h, x_center, infer_y),
-        _arrow_line(x_center, infer_y + stack_h, x_center, gossip_y),
-        _arrow_line(x_center, gossip_y + stack_h, x_center, consensus_y),
-        # consensus branch split
-        _line(x_center, consensus_y + stack_h, x_center, 820),
-        _line(x_center, 820, trilat_x + (branch_w // 2), 820),
-        _line(x_center, 820, tomo_x + (branch_w // 2), 820),
-        _arrow_line(trilat_x + (branch_w // 2), 820, trilat_x + (branch_w // 2), branch_y),
-        _arrow_line(tomo_x + (branch_w // 2), 820, tomo_x + (branch_w // 2), branch_y),
-        # merge to world state
-        _arrow_line(trilat_x + (branch_w // 2), branch_y + branch_h, x_center, world_y),
-        _arrow_line(tomo_x + (branch_w // 2), branch_y + branch_h, x_center, world_y),
-        _arrow_line(x_center, world_y + world_h, x_center, dash_y),
-        "</svg>",
-    ]
-    return "\n".join(parts)
+    trilat_cx = trilat_x + (branch_w // 2)
+    tomo_cx = tomo_x + (branch_w // 2)
+
+    _emit(out, '<?xml version="1.0" encoding="UTF-8"?>')
+    _emit(
+        out,
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{CANVAS_W}" '
+        f'height="{CANVAS_H}" viewBox="0 0 {CANVAS_W} {CANVAS_H}">'
+    )
+    _emit(out, "<defs>")
+    _emit(
+        out,
+        f'<marker id="arrow" markerWidth="12" markerHeight="12" refX="9" refY="6" '
+        f'orient="auto"><path d="M0,0 L0,12 L10,6 z" fill="{STROKE}"/></marker>'
+    )
+    _emit(
+        out,
+        '<filter id="softShadow" x="-20%" y="-20%" width="140%" height="140%">'
+        '<feDropShadow dx="0" dy="4" stdDeviation="6" flood-color="#020617" '
+        'flood-opacity="0.55"/></filter>'
+    )
+    _emit(out, "</defs>")
+    _emit(out, f'<rect x="0" y="0" width="{CANVAS_W}" height="{CANVAS_H}" fill="{BG}"/>')
+    _emit(
+        out,
+        f'<text x="{x_center}" y="58" fill="{TEXT}" {FONT_MONO} '
+        f'font-size="36" {ANCHOR_MID}>Senseye Node Pipeline</text>'
+    )
+    _emit(
+        out,
+        f'<text x="{x_center}" y="88" fill="{MUTED}" {FONT_MONO} font-size="18" '
+        f'{ANCHOR_MID}>scan → filter → infer → share → fuse → render</text>'
+    )
+    _emit(out, '<g filter="url(#softShadow)">')
+    _box_into(
+        out,
+        stack_x,
+        signals_y,
+        stack_w,
+        stack_h,
+        "Signals",
+        "WiFi / BLE / Acoustic",
+        fill=PANEL_ALT,
+    )
+    _box_into(out, stack_x, scan_y, stack_w, stack_h, "Scan")
+    _box_into(out, stack_x, kalman_y, stack_w, stack_h, "Adaptive Kalman", "Per link")
+    _box_into(
+        out, stack_x, infer_y, stack_w, stack_h, "Infer", "Links / Devices / Zones + Confidence"
+    )
+    _box_into(
+        out,
+        stack_x,
+        gossip_y,
+        stack_w,
+        stack_h,
+        "Gossip Mesh",
+        "mDNS + TCP, sequence dedup, hop TTL",
+        fill=PANEL_ALT,
+    )
+    _box_into(out, stack_x, consensus_y, stack_w, stack_h, "Consensus Fusion")
+    _box_into(out, trilat_x, branch_y, branch_w, branch_h, "Trilateration")
+    _box_into(out, tomo_x, branch_y, branch_w, branch_h, "Tomography")
+    _box_into(
+        out, world_x, world_y, world_w, world_h, "World State", "Static map + dynamic overlay"
+    )
+    _box_into(out, dash_x, dash_y, dash_w, dash_h, "Dashboard", fill=PANEL_ALT)
+    _emit(out, "</g>")
+    # vertical stack arrows
+    _arrow_line_into(out, x_center, signals_y + stack_h, x_center, scan_y)
+    _arrow_line_into(out, x_center, scan_y + stack_h, x_center, kalman_y)
+    _arrow_line_into(out, x_center, kalman_y + stack_h, x_center, infer_y)
+    _arrow_line_into(out, x_center, infer_y + stack_h, x_center, gossip_y)
+    _arrow_line_into(out, x_center, gossip_y + stack_h, x_center, consensus_y)
+    # consensus branch split; one path, arrows need their own <line> for marker-end
+    _path_into(
+        out,
+        [
+            (x_center, consensus_y + stack_h, x_center, 820),
+            (x_center, 820, trilat_cx, 820),
+            (x_center, 820, tomo_cx, 820),
+        ],
+    )
+    _arrow_line_into(out, trilat_cx, 820, trilat_cx, branch_y)
+    _arrow_line_into(out, tomo_cx, 820, tomo_cx, branch_y)
+    # merge to world state
+    _arrow_line_into(out, trilat_cx, branch_y + branch_h, x_center, world_y)
+    _arrow_line_into(out, tomo_cx, branch_y + branch_h, x_center, world_y)
+    _arrow_line_into(out, x_center, world_y + world_h, x_center, dash_y)
+    _emit(out, "</svg>")
 
 
 def main() -> None:
@@ -179,7 +218,13 @@ def main() -> None:
     assets = root / "assets"
     assets.mkdir(parents=True, exist_ok=True)
     output = assets / "node-pipeline.svg"
-    output.write_text(build_svg(), encoding="utf-8")
+    buf = io.StringIO()
+    write_svg(buf)
+    payload = _minify(buf.getvalue()).encode("utf-8")
+    if output.exists() and output.read_bytes() == payload:
+        print(f"unchanged {output}")
+        return
+    output.write_bytes(payload)
     print(f"wrote {output}")
 
 
@@ -3,31 +3,48 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
+import io
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import TextIO
 
-BG = "#0b1020"
-PANEL = "#10192e"
-PANEL_ALT = "#132244"
-STROKE = "#7dd3fc"
-TEXT = "#e5f3ff"
-MUTED = "#9fb7d5"
-ACCENT_WARM = "#f59e0b"
-ACCENT_HOT = "#fb7185"
-ACCENT_GOOD = "#34d399"
+import numpy as np
 
+# Interned: these recur in thousands of fragments and as cache/format keys.
+BG = sys.intern("#0b1020")
+PANEL = sys.intern("#10192e")
+PANEL_ALT = sys.intern("#132244")
+STROKE = sys.intern("#7dd3fc")
+TEXT = sys.intern("#e5f3ff")
+MUTED = sys.intern("#9fb7d5")
+ACCENT_WARM = sys.intern("#f59e0b")
+ACCENT_HOT = sys.intern("#fb7185")
+ACCENT_GOOD = sys.intern("#34d399")
 
-def _svg_header(width: int, height: int, title: str) -> list[str]:
-    return [
-        '<?xml version="1.0" encoding="UTF-8"?>',
-        (
-            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
-            f'height="{height}" viewBox="0 0 {width} {height}">'
-        ),
+FONT_MONO = 'font-family="ui-monospace, SFMono-Regular, Menlo, monospace"'
+ANCHOR_MID = 'text-anchor="middle"'
+
+
+# Every fill colour _node is called with; one <symbol> is emitted per fill so
+# each node instance is a single <use> reference instead of a full circle.
+_NODE_FILLS = ("#1e3a8a", PANEL_ALT, "#0f766e", "#7c3aed")
+
+
+def _node_symbol_id(fill: str) -> str:
+    return f"nodeGlyph-{fill.lstrip('#')}"
+
+
+# Shared <defs> block; only STROKE varies and it is a module constant, so render once.
+_DEFS_BLOCK = "\n".join(
+    [
         "<defs>",
         (
             f'<marker id="arrow" markerWidth="12" markerHeight="12" refX="9" refY="6" '
-            'orient="auto"><path d="M0,0 L0,12 L10,6 z" '
-            f'fill="{STROKE}"/></marker>'
+            f'orient="auto"><path d="M0,0 L0,12 L10,6 z" fill="{STROKE}"/></marker>'
         ),
         (
             '<filter id="softShadow" x="-20%" y="-20%" width="140%" height="140%">'
@@ -40,13 +57,65 @@ def _svg_header(width: int, height: int, title: str) -> list[str]:
             '<stop offset="100%" stop-color="#0b1020"/>'
             "</linearGradient>"
         ),
+        *(
+            f'<symbol id="{_node_symbol_id(fill)}" overflow="visible">'
+            f'<circle cx="0" cy="0" r="15" fill="{fill}" stroke="{STROKE}" stroke-width="2"/>'
+            "</symbol>"
+            for fill in _NODE_FILLS
+        ),
         "</defs>",
+    ]
+)
+
+
+_WS_BETWEEN_TAGS = re.compile(r">\s+<")
+
+# Fragment templates are parsed once at import; helpers fill in the variables.
+_LINE_SOLID_TMPL = (
+    '<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" stroke="{color}" stroke-width="{width}"/>'
+)
+_LINE_DASHED_TMPL = (
+    '<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
+    'stroke="{color}" stroke-width="{width}" stroke-dasharray="8 8"/>'
+)
+_LINE_ARROW_TMPL = (
+    '<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
+    'stroke="{color}" stroke-width="{width}" marker-end="url(#arrow)"/>'
+)
+_LABEL_TMPL = (
+    '<text x="{x}" y="{y}" fill="{color}" '
+    f"{FONT_MONO} "
+    f'font-size="{{size}}" {ANCHOR_MID}>{{text}}</text>'
+)
+_LABEL_LEFT_TMPL = (
+    '<text x="{x}" y="{y}" fill="{color}" '
+    f"{FONT_MONO} "
+    'font-size="{size}" text-anchor="start">{text}</text>'
+)
+_NODE_TMPL = (
+    '<use href="#{sid}" x="{x}" y="{y}"/>\n'
+    f'<text x="{{x}}" y="{{label_y}}" fill="{TEXT}" {FONT_MONO} '
+    f'font-size="14" {ANCHOR_MID}>{{label}}</text>'
+)
+
+
+def _minify(svg: str) -> str:
+    """Collapse inter-element whitespace; attribute values and text stay intact."""
+    return _WS_BETWEEN_TAGS.sub("><", svg).strip() + "\n"
+
+
+def _svg_header(width: int, height: int, title: str) -> list[str]:
+    return [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        (
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" '
+            f'height="{height}" viewBox="0 0 {width} {height}">'
+        ),
+        _DEFS_BLOCK,
         f'<rect x="0" y="0" width="{width}" height="{height}" fill="url(#bgGrad)"/>',
         (
-            f'<text x="{width // 2}" y="42" fill="{TEXT}" '
-            'font-family="ui-monospace, SFMono-Regular, Menlo, monospace" '
-            'font-size="28" text-anchor="middle">'
-            f"{title}</text>"
+            f'<text x="{width // 2}" y="42" fill="{TEXT}" {FONT_MONO} '
+            f'font-size="28" {ANCHOR_MID}>{title}</text>'
         ),
     ]
 
@@ -55,6 +124,13 @@ def _svg_footer() -> list[str]:
     return ["</svg>"]
 
 
+def _write_parts(out: TextIO, parts: list[str]) -> None:
+    for fragment in parts:
+        out.write(fragment)
+        out.write("\n")
+
+
+@functools.lru_cache(maxsize=4096)
 def _box(
     x: int,
     y: int,
@@ -64,30 +140,44 @@ def _box(
     subtitle: str | None = None,
     fill: str = PANEL,
 ) -> str:
+    cx = x + w // 2
+    title_y = y + 36
+    subtitle_y = y + 62
     parts = [
         (
             f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="12" '
             f'fill="{fill}" stroke="{STROKE}" stroke-width="2" filter="url(#softShadow)"/>'
         ),
         (
-            f'<text x="{x + w // 2}" y="{y + 36}" fill="{TEXT}" '
-            'font-family="ui-monospace, SFMono-Regular, Menlo, monospace" '
-            'font-size="24" text-anchor="middle">'
-            f"{title}</text>"
+            f'<text x="{cx}" y="{title_y}" fill="{TEXT}" {FONT_MONO} '
+            f'font-size="24" {ANCHOR_MID}>{title}</text>'
         ),
     ]
     if subtitle:
         parts.append(
             (
-                f'<text x="{x + w // 2}" y="{y + 62}" fill="{MUTED}" '
-                'font-family="ui-monospace, SFMono-Regular, Menlo, monospace" '
-                'font-size="17" text-anchor="middle">'
-                f"{subtitle}</text>"
+                f'<text x="{cx}" y="{subtitle_y}" fill="{MUTED}" {FONT_MONO} '
+                f'font-size="17" {ANCHOR_MID}>{subtitle}</text>'
             ),
         )
     return "\n".join(parts)
 
 
+@functools.lru_cache(maxsize=4096)
+def _line_solid(x1: int, y1: int, x2: int, y2: int, *, color: str = STROKE, width: int = 3) -> str:
+    return _LINE_SOLID_TMPL.format(x1=x1, y1=y1, x2=x2, y2=y2, color=color, width=width)
+
+
+@functools.lru_cache(maxsize=4096)
+def _line_dashed(x1: int, y1: int, x2: int, y2: int, *, color: str = STROKE, width: int = 3) -> str:
+    return _LINE_DASHED_TMPL.format(x1=x1, y1=y1, x2=x2, y2=y2, color=color, width=width)
+
+
+@functools.lru_cache(maxsize=4096)
+def _line_arrow(x1: int, y1: int, x2: int, y2: int, *, color: str = STROKE, width: int = 3) -> str:
+    return _LINE_ARROW_TMPL.format(x1=x1, y1=y1, x2=x2, y2=y2, color=color, width=width)
+
+
 def _line(
     x1: int,
     y1: int,
@@ -99,84 +189,65 @@ def _line(
     dashed: bool = False,
     arrow: bool = False,
 ) -> str:
-    dash = ' stroke-dasharray="8 8"' if dashed else ""
-    marker = ' marker-end="url(#arrow)"' if arrow else ""
-    return (
-        f'<line x1="{x1}" y1="{y1}" x2="{x2}" y2="{y2}" '
-        f'stroke="{color}" stroke-width="{width}"{dash}{marker}/>'
-    )
+    if dashed:
+        return _line_dashed(x1, y1, x2, y2, color=color, width=width)
+    if arrow:
+        return _line_arrow(x1, y1, x2, y2, color=color, width=width)
+    return _line_solid(x1, y1, x2, y2, color=color, width=width)
 
 
+@functools.lru_cache(maxsize=4096)
 def _label(x: int, y: int, text: str, color: str = MUTED, size: int = 16) -> str:
-    return (
-        f'<text x="{x}" y="{y}" fill="{color}" '
-        'font-family="ui-monospace, SFMono-Regular, Menlo, monospace" '
-        f'font-size="{size}" text-anchor="middle">{text}</text>'
-    )
+    return _LABEL_TMPL.format(x=x, y=y, text=text, color=color, size=size)
 
 
+@functools.lru_cache(maxsize=4096)
 def _label_left(x: int, y: int, text: str, color: str = MUTED, size: int = 16) -> str:
-    return (
-        f'<text x="{x}" y="{y}" fill="{color}" '
-        'font-family="ui-monospace, SFMono-Regular, Menlo, monospace" '
-        f'font-size="{size}" text-anchor="start">{text}</text>'
-    )
+    return _LABEL_LEFT_TMPL.format(x=x, y=y, text=text, color=color, size=size)
 
 
+@functools.lru_cache(maxsize=4096)
 def _node(x: int, y: int, label: str, fill: str = "#1e3a8a") -> str:
-    return "\n".join(
-        [
-            (
-                f'<circle cx="{x}" cy="{y}" r="15" fill="{fill}" '
-                f'stroke="{STROKE}" stroke-width="2"/>'
-            ),
-            (
-                f'<text x="{x}" y="{y + 6}" fill="{TEXT}" '
-                'font-family="ui-monospace, SFMono-Regular, Menlo, monospace" '
-                'font-size="14" text-anchor="middle">'
-                f"{label}</text>"
-            ),
-        ],
-    )
+    return _NODE_TMPL.format(sid=_node_symbol_id(fill), x=x, y=y, label_y=y + 6, label=label)
 
 
-def build_phase1() -> str:
+def write_phase1(out: TextIO) -> None:
     width, height = 1200, 560
     parts = _svg_header(width, height, "Phase 1: Passive RF Sensing")
     parts += [
         _box(80, 130, 320, 108, "Zone 1", "candidate", fill=PANEL_ALT),
         _box(800, 130, 320, 108, "Zone 2", "candidate", fill=PANEL_ALT),
         _box(440, 320, 320, 108, "Zone 3", "candidate", fill=PANEL),
-        _line(400, 184, 800, 184, width=5),
-        _line(240, 238, 560, 320, color=ACCENT_WARM, width=5),
-        _line(960, 238, 640, 320, color="#cbd5e1", width=4, dashed=True),
+        _line_solid(400, 184, 800, 184, width=5),
+        _line_solid(240, 238, 560, 320, color=ACCENT_WARM, width=5),
+        _line_dashed(960, 238, 640, 320, color="#cbd5e1", width=4),
         _label(600, 112, "Strong Link", color=TEXT, size=19),
         _label(250, 288, "High Attenuation", color=ACCENT_WARM, size=17),
         _label(956, 288, "Weak Evidence", color="#cbd5e1", size=17),
         '<rect x="70" y="408" width="380" height="118" rx="10" '
         f'fill="{PANEL}" stroke="{STROKE}" stroke-width="1.5"/>',
         _label_left(92, 436, "Legend", color=TEXT, size=16),
-        _line(95, 456, 170, 456, width=4),
+        _line_solid(95, 456, 170, 456, width=4),
         _label_left(188, 462, "Strong RF link", color=TEXT, size=15),
-        _line(95, 482, 170, 482, color=ACCENT_WARM, width=4),
+        _line_solid(95, 482, 170, 482, color=ACCENT_WARM, width=4),
         _label_left(188, 488, "Attenuation spike", color=ACCENT_WARM, size=15),
-        _line(95, 508, 170, 508, color="#cbd5e1", width=3, dashed=True),
+        _line_dashed(95, 508, 170, 508, color="#cbd5e1", width=3),
         _label_left(188, 514, "Weak evidence link", color="#cbd5e1", size=15),
     ]
     parts += _svg_footer()
-    return "\n".join(parts)
+    _write_parts(out, parts)
 
 
-def build_phase2() -> str:
+def write_phase2(out: TextIO) -> None:
     width, height = 1200, 620
     parts = _svg_header(width, height, "Phase 2: Acoustic Calibration")
     parts += [
         '<rect x="210" y="110" width="780" height="420" rx="16" '
         f'fill="{PANEL}" stroke="{STROKE}" stroke-width="2" filter="url(#softShadow)"/>',
         # room split lines
-        _line(600, 110, 600, 260, color=STROKE, width=2),
-        _line(600, 330, 600, 530, color=STROKE, width=2),
-        _line(210, 320, 990, 320, color=STROKE, width=2),
+        _line_solid(600, 110, 600, 260, color=STROKE, width=2),
+        _line_solid(600, 330, 600, 530, color=STROKE, width=2),
+        _line_solid(210, 320, 990, 320, color=STROKE, width=2),
         _label(380, 230, "kitchen", color=TEXT, size=26),
         _label(800, 230, "hallway", color=TEXT, size=26),
         _label(380, 445, "bedroom", color=TEXT, size=26),
@@ -188,18 +259,18 @@ def build_phase2() -> str:
         _label(600, 575, "cm-accurate ranges -> MDS -> structured floorplan", size=17),
     ]
     parts += _svg_footer()
-    return "\n".join(parts)
+    _write_parts(out, parts)
 
 
-def build_phase3() -> str:
+def write_phase3(out: TextIO) -> None:
     width, height = 1200, 640
     parts = _svg_header(width, height, "Phase 3: Motion-Refined Overlay")
     parts += [
         '<rect x="210" y="110" width="780" height="420" rx="16" '
         f'fill="{PANEL}" stroke="{STROKE}" stroke-width="2" filter="url(#softShadow)"/>',
-        _line(600, 110, 600, 260, color=STROKE, width=2),
-        _line(600, 330, 600, 530, color=STROKE, width=2),
-        _line(210, 320, 990, 320, color=STROKE, width=2),
+        _line_solid(600, 110, 600, 260, color=STROKE, width=2),
+        _line_solid(600, 330, 600, 530, color=STROKE, width=2),
+        _line_solid(210, 320, 990, 320, color=STROKE, width=2),
         # heat overlays
         '<rect x="610" y="330" width="370" height="190" rx="10" '
         'fill="#e11d48" opacity="0.55" stroke="#fb7185" stroke-width="2"/>',
@@ -224,7 +295,7 @@ def build_phase3() -> str:
         _label(600, 586, "motion: living high, kitchen low", size=17),
     ]
     parts += _svg_footer()
-    return "\n".join(parts)
+    _write_parts(out, parts)
 
 
 def _network_panel(
@@ -236,21 +307,60 @@ def _network_panel(
     nodes: dict[str, tuple[int, int]],
     edges: list[tuple[str, str]],
 ) -> str:
+    cx = x + (w // 2)
     parts = [
         f'<rect x="{x}" y="{y}" width="{w}" height="{h}" rx="12" fill="{PANEL}" '
         f'stroke="{STROKE}" stroke-width="2" filter="url(#softShadow)"/>',
-        _label(x + (w // 2), y + 30, title, color=TEXT, size=16),
+        _label(cx, y + 30, title, color=TEXT, size=16),
     ]
     for a, b in edges:
         x1, y1 = nodes[a]
         x2, y2 = nodes[b]
-        parts.append(_line(x1, y1, x2, y2, width=2, color="#3b82f6"))
+        parts.append(_line_solid(x1, y1, x2, y2, width=2, color="#3b82f6"))
     for name, (nx, ny) in nodes.items():
         parts.append(_node(nx, ny, name, fill=PANEL_ALT))
     return "\n".join(parts)
 
 
-def build_connectivity() -> str:
+def _grid_nodes(
+    labels: list[str],
+    origin_x: int,
+    origin_y: int,
+    cols: int,
+    rows: int,
+    dx: int,
+    dy: int,
+) -> dict[str, tuple[int, int]]:
+    """Lay out ``labels`` on a ``cols`` x ``rows`` grid in one vectorized pass."""
+    xs, ys = np.meshgrid(
+        np.arange(cols) * dx + origin_x,
+        np.arange(rows) * dy + origin_y,
+    )
+    return dict(zip(labels, zip(xs.ravel().tolist(), ys.ravel().tolist())))
+
+
+def _grid_edges(labels: list[str], cols: int, rows: int) -> list[tuple[str, str]]:
+    """Horizontal, vertical, and diagonal neighbour edges for a grid of nodes."""
+
+    def at(r: int, c: int) -> str:
+        return labels[r * cols + c]
+
+    edges = [(at(r, c), at(r, c + 1)) for r in range(rows) for c in range(cols - 1)]
+    edges += [(at(r, c), at(r + 1, c)) for c in range(cols) for r in range(rows - 1)]
+    for r in range(rows - 1):
+        for c in range(cols - 1):
+            edges.append((at(r, c), at(r + 1, c + 1)))
+            edges.append((at(r, c + 1), at(r + 1, c)))
+    return edges
+
+
+# Dense "8+ style" panel layout is fixed; enumerate its labels and neighbour
+# edges once at import instead of per render.
+_GRID4_LABELS = tuple(str(i) for i in range(1, 10))
+_GRID4_EDGES = tuple(_grid_edges(list(_GRID4_LABELS), 3, 3))
+
+
+def write_connectivity(out: TextIO) -> None:
     width, height = 1500, 700
     parts = _svg_header(width, height, "Node Connectivity Scaling")
 
@@ -264,11 +374,7 @@ def build_connectivity() -> str:
     p3x = p2x + panel_w + gap
     p4x = p3x + panel_w + gap
 
-    nodes1 = {
-        "n1": (p1x + 165, top + 180),
-        "r": (p1x + 165, top + 290),
-        "b": (p1x + 165, top + 400),
-    }
+    nodes1 = _grid_nodes(["n1", "r", "b"], p1x + 165, top + 180, 1, 3, 0, 110)
     edges1 = [("n1", "r"), ("r", "b")]
 
     nodes2 = {
@@ -278,12 +384,7 @@ def build_connectivity() -> str:
     }
     edges2 = [("n1", "n2"), ("n2", "n3"), ("n1", "n3")]
 
-    nodes3 = {
-        "n1": (p3x + 95, top + 180),
-        "n2": (p3x + 235, top + 180),
-        "n3": (p3x + 95, top + 360),
-        "n4": (p3x + 235, top + 360),
-    }
+    nodes3 = _grid_nodes(["n1", "n2", "n3", "n4"], p3x + 95, top + 180, 2, 2, 140, 180)
     edges3 = [
         ("n1", "n2"),
         ("n1", "n3"),
@@ -293,28 +394,8 @@ def build_connectivity() -> str:
         ("n3", "n4"),
     ]
 
-    nodes4 = {
-        "1": (p4x + 75, top + 170),
-        "2": (p4x + 165, top + 170),
-        "3": (p4x + 255, top + 170),
-        "4": (p4x + 75, top + 280),
-        "5": (p4x + 165, top + 280),
-        "6": (p4x + 255, top + 280),
-        "7": (p4x + 75, top + 390),
-        "8": (p4x + 165, top + 390),
-        "9": (p4x + 255, top + 390),
-    }
-    # Dense local edges for readable "8+ style" panel.
-    edges4 = [
-        ("1", "2"), ("2", "3"),
-        ("4", "5"), ("5", "6"),
-        ("7", "8"), ("8", "9"),
-        ("1", "4"), ("4", "7"),
-        ("2", "5"), ("5", "8"),
-        ("3", "6"), ("6", "9"),
-        ("1", "5"), ("2", "4"), ("2", "6"), ("3", "5"),
-        ("4", "8"), ("5", "7"), ("5", "9"), ("6", "8"),
-    ]
+    nodes4 = _grid_nodes(list(_GRID4_LABELS), p4x + 75, top + 170, 3, 3, 90, 110)
+    edges4 = list(_GRID4_EDGES)
 
     parts += [
         _network_panel(p1x, top, panel_w, panel_h, "1 node", nodes1, edges1),
@@ -330,23 +411,48 @@ def build_connectivity() -> str:
     ]
 
     parts += _svg_footer()
-    return "\n".join(parts)
+    _write_parts(out, parts)
+
+
+# Outputs are a pure function of this module's source, so cache renders on disk
+# keyed by a hash of the file and reuse them across unchanged runs.
+SRC_HASH = hashlib.blake2b(Path(__file__).read_bytes()).hexdigest()[:16]
+
+_OUTPUTS = {
+    "phase-1-rf-zones.svg": write_phase1,
+    "phase-2-acoustic-floorplan.svg": write_phase2,
+    "phase-3-motion-overlay.svg": write_phase3,
+    "node-connectivity-scaling.svg": write_connectivity,
+}
+
+
+def _render(name: str) -> tuple[str, bytes]:
+    buf = io.StringIO()
+    _OUTPUTS[name](buf)
+    return name, _minify(buf.getvalue()).encode("utf-8")
 
 
 def main() -> None:
     root = Path(__file__).resolve().parents[1]
     assets = root / "assets"
     assets.mkdir(parents=True, exist_ok=True)
-
-    outputs = {
-        "phase-1-rf-zones.svg": build_phase1(),
-        "phase-2-acoustic-floorplan.svg": build_phase2(),
-        "phase-3-motion-overlay.svg": build_phase3(),
-        "node-connectivity-scaling.svg": build_connectivity(),
-    }
-    for name, svg in outputs.items():
+    cache = root / ".cache" / "readme-assets" / SRC_HASH
+    cache.mkdir(parents=True, exist_ok=True)
+
+    missing = [name for name in _OUTPUTS if not (cache / name).exists()]
+    if missing:
+        # The builders are independent and CPU-bound; render them across cores.
+        with ProcessPoolExecutor(max_workers=len(missing)) as pool:
+            for name, payload in pool.map(_render, missing):
+                (cache / name).write_bytes(payload)
+
+    for name in _OUTPUTS:
+        payload = (cache / name).read_bytes()
         path = assets / name
-        path.write_text(svg, encoding="utf-8")
+        if path.exists() and path.read_bytes() == payload:
+            print(f"unchanged {path}")
+            continue
+        path.write_bytes(payload)
         print(f"wrote {path}")
 
 
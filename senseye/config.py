@@ -2,12 +2,21 @@
 
 from __future__ import annotations
 
-import uuid
+import functools
+import re
 from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 
 
+def _random_node_id() -> str:
+    # Deferred like tomllib below: uuid drags in platform/inspect, which is a
+    # quarter of this module's import time and only needed without a config file.
+    import uuid
+
+    return uuid.uuid4().hex[:12]
+
+
 class NodeRole(Enum):
     FIXED = "fixed"
     MOBILE = "mobile"
@@ -19,7 +28,7 @@ class AcousticMode(Enum):
     INTERVAL = "interval"
 
 
-@dataclass
+@dataclass(slots=True)
 class Position:
     x: float
     y: float
@@ -28,7 +37,7 @@ class Position:
 @dataclass
 class SenseyeConfig:
     # Node identity
-    node_id: str = field(default_factory=lambda: uuid.uuid4().hex[:12])
+    node_id: str = field(default_factory=lambda: _random_node_id())
     node_name: str = ""
     node_role: NodeRole = NodeRole.FIXED
     position: Position | None = None
@@ -62,12 +71,26 @@ class SenseyeConfig:
             self.node_name = self.node_id
 
 
+# (path, mtime) -> parsed overrides; repeat loads of an unchanged file are free.
+_config_file_cache: dict[Path, tuple[float, dict]] = {}
+
+
 def load_config_file(path: Path) -> dict:
-    """Load config overrides from a TOML file. Returns empty dict if not found."""
+    """Load config overrides from a TOML file. Returns empty dict if not found.
+
+    Parsing uses the C-backed stdlib tomllib (3.11+); results are memoized by
+    file mtime, so callers may not mutate the returned dict.
+    """
     if not path.exists():
         return {}
+    mtime = path.stat().st_mtime
+    cached = _config_file_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
     import tomllib
-    return tomllib.loads(path.read_text())
+    parsed = tomllib.loads(path.read_text())
+    _config_file_cache[path] = (mtime, parsed)
+    return parsed
 
 
 def apply_overrides(config: SenseyeConfig, overrides: dict) -> SenseyeConfig:
@@ -91,6 +114,35 @@ def apply_overrides(config: SenseyeConfig, overrides: dict) -> SenseyeConfig:
     return config
 
 
+# One compiled pattern covers mode and interval so CLI parsing scans the
+# argument once; group 2/3 carry the interval value and unit when present.
+_ACOUSTIC_RE = re.compile(r"^(off|on-demand|(\d+(?:\.\d+)?)([smh]?))$")
+_UNIT_SECONDS = {"": 1.0, "s": 1.0, "m": 60.0, "h": 3600.0}
+
+
+@functools.lru_cache(maxsize=64)
+def parse_acoustic(s: str) -> tuple[AcousticMode, float | None]:
+    """Parse an acoustic argument ('off', 'on-demand', '10m', '1h', '300', ...).
+
+    Returns (mode, interval_seconds); the interval is None unless the mode is
+    INTERVAL. Single pass over the string instead of mode + interval parses.
+    """
+    text = s.lower().strip()
+    match = _ACOUSTIC_RE.match(text)
+    if match is None:
+        # Preserve the historical tolerant/raising behavior for odd inputs.
+        mode = _parse_acoustic_mode(text)
+        interval = parse_acoustic_interval(text) if mode is AcousticMode.INTERVAL else None
+        return mode, interval
+    token = match.group(1)
+    if token == "off":
+        return AcousticMode.OFF, None
+    if token == "on-demand":
+        return AcousticMode.ON_DEMAND, None
+    return AcousticMode.INTERVAL, float(match.group(2)) * _UNIT_SECONDS[match.group(3)]
+
+
+@functools.lru_cache(maxsize=64)
 def _parse_acoustic_mode(s: str) -> AcousticMode:
     """Parse acoustic mode string: 'off', 'on-demand', '10m', '1h', etc."""
     s = s.lower().strip()
@@ -101,6 +153,7 @@ def _parse_acoustic_mode(s: str) -> AcousticMode:
     return AcousticMode.INTERVAL
 
 
+@functools.lru_cache(maxsize=64)
 def parse_acoustic_interval(s: str) -> float:
     """Parse interval string like '10m' or '1h' into seconds."""
     s = s.lower().strip()
@@ -22,16 +22,23 @@ def build_distance_matrix(
     """
     n = len(node_ids)
     idx = {nid: i for i, nid in enumerate(node_ids)}
-    matrix = np.zeros((n, n))
-
-    for (src, tgt), tof in tof_measurements.items():
-        i = idx.get(src)
-        j = idx.get(tgt)
-        if i is None or j is None:
-            continue
-        dist = tof * SPEED_OF_SOUND
-        matrix[i, j] = dist
-        matrix[j, i] = dist  # symmetric
+    # float32 is ample for meter-scale distances and halves the bytes moved.
+    matrix = np.zeros((n, n), dtype=np.float32)
+
+    pairs = [
+        (idx[src], idx[tgt], tof)
+        for (src, tgt), tof in tof_measurements.items()
+        if src in idx and tgt in idx
+    ]
+    if not pairs:
+        return matrix
+
+    arr = np.array(pairs, dtype=np.float64)
+    rows = arr[:, 0].astype(np.intp)
+    cols = arr[:, 1].astype(np.intp)
+    dists = arr[:, 2] * SPEED_OF_SOUND
+    matrix[rows, cols] = dists
+    matrix[cols, rows] = dists  # symmetric
 
     return matrix
 
@@ -55,6 +62,13 @@ def merge_distances(
     if has_acoustic is None:
         has_acoustic = acoustic > 0
 
+    # All-or-nothing masks are common (no acoustic samples at all, or full
+    # coverage); return the source matrix and skip the n^2 blend allocation.
+    if not has_acoustic.any():
+        return rf
+    if has_acoustic.all():
+        return acoustic
+
     return np.where(has_acoustic, acoustic, rf)
 
 
@@ -76,44 +90,40 @@ def propagate_distances(
     hop_limit = max(int(max_hops), 2)
 
     # Best known path length and hop count for each pair.
-    dist = np.full((n, n), np.inf, dtype=np.float64)
-    hops = np.full((n, n), np.inf, dtype=np.float64)
+    dist = np.full((n, n), np.inf, dtype=np.float32)
+    hops = np.full((n, n), np.inf, dtype=np.float32)
     np.fill_diagonal(dist, 0.0)
     np.fill_diagonal(hops, 0.0)
 
     direct_mask = acoustic > 0
+
+    # Multi-hop paths only matter for unmeasured pairs and need at least two
+    # direct edges; skip the O(n^3) relaxation entirely when it cannot help.
+    unmeasured = ~direct_mask
+    np.fill_diagonal(unmeasured, False)
+    if not unmeasured.any() or np.count_nonzero(direct_mask) < 4:
+        return acoustic.copy()
+
     dist[direct_mask] = acoustic[direct_mask]
     hops[direct_mask] = 1.0
 
+    # Hop-limited Floyd-Warshall, relaxed one pivot at a time via broadcasting.
+    # Infinities flow through the arithmetic and fail every comparison, so no
+    # per-cell isfinite checks are needed.
     for k in range(n):
-        for i in range(n):
-            dik = dist[i, k]
-            hik = hops[i, k]
-            if not np.isfinite(dik) or not np.isfinite(hik):
-                continue
-            for j in range(n):
-                dkj = dist[k, j]
-                hkj = hops[k, j]
-                if not np.isfinite(dkj) or not np.isfinite(hkj):
-                    continue
-                cand_hops = hik + hkj
-                if cand_hops <= 1 or cand_hops > hop_limit:
-                    continue
-                cand_dist = dik + dkj
-                if cand_dist < dist[i, j]:
-                    dist[i, j] = cand_dist
-                    hops[i, j] = cand_hops
+        cand_dist = dist[:, k, None] + dist[None, k, :]
+        cand_hops = hops[:, k, None] + hops[None, k, :]
+        better = (cand_hops > 1) & (cand_hops <= hop_limit) & (cand_dist < dist)
+        dist[better] = cand_dist[better]
+        hops[better] = cand_hops[better]
 
     propagated = acoustic.copy()
-    for i in range(n):
-        for j in range(i + 1, n):
-            if propagated[i, j] > 0:
-                continue
-            if not np.isfinite(dist[i, j]) or not np.isfinite(hops[i, j]):
-                continue
-            if hops[i, j] < 2 or hops[i, j] > hop_limit:
-                continue
-            propagated[i, j] = dist[i, j]
-            propagated[j, i] = dist[i, j]
+    fill = (
+        (propagated == 0)
+        & np.isfinite(dist)
+        & (hops >= 2)
+        & (hops <= hop_limit)
+    )
+    propagated[fill] = dist[fill]
 
     return propagated
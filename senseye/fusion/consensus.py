@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import numpy as np
+
 from senseye.node.belief import Belief, DeviceState, LinkState, ZoneBelief
 
 _EPS = 1e-6
@@ -9,6 +11,12 @@ _EPS = 1e-6
 
 def fuse_beliefs(local: Belief, peer_beliefs: dict[str, Belief]) -> Belief:
     """Fuse local and peer beliefs with inverse-variance weighting."""
+    # Steady state without gossip updates: fusing a single belief is an
+    # algebraic no-op (weighted mean of one sample, unit agreement penalty,
+    # confidence maps back onto itself), so skip the whole pipeline.
+    if not peer_beliefs:
+        return local
+
     all_beliefs = [local] + list(peer_beliefs.values())
     timestamp = max((belief.timestamp for belief in all_beliefs), default=local.timestamp)
     return Belief(
@@ -34,133 +42,139 @@ def _precision_from_confidence(confidence: float) -> float:
     return 1.0 / _variance_from_confidence(confidence)
 
 
-def _weighted_mean(values: list[float], weights: list[float]) -> float:
-    total_weight = sum(weights)
-    if total_weight <= _EPS:
-        return 0.0
-    return sum(value * weight for value, weight in zip(values, weights)) / total_weight
-
-
-def _weighted_variance(values: list[float], weights: list[float], mean: float) -> float:
-    total_weight = sum(weights)
-    if total_weight <= _EPS:
-        return 0.0
-    return (
-        sum(weight * ((value - mean) ** 2) for value, weight in zip(values, weights))
-        / total_weight
+def _index_ids(ids: list[str]) -> dict[str, int]:
+    """First-seen order -> dense index, so bincount rows line up with output order."""
+    index: dict[str, int] = {}
+    for identifier in ids:
+        if identifier not in index:
+            index[identifier] = len(index)
+    return index
+
+
+def _weighted_group_means(
+    idx: np.ndarray,
+    values: np.ndarray,
+    weights: np.ndarray,
+    size: int,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Per-group weighted means and total weights in one bincount pass each."""
+    total = np.bincount(idx, weights=weights, minlength=size)
+    sums = np.bincount(idx, weights=values * weights, minlength=size)
+    return sums / np.maximum(total, _EPS), total
+
+
+def _weighted_group_variances(
+    idx: np.ndarray,
+    values: np.ndarray,
+    weights: np.ndarray,
+    means: np.ndarray,
+    totals: np.ndarray,
+    size: int,
+) -> np.ndarray:
+    """Per-group weighted variances via E[x^2] - mean^2, one extra pass."""
+    sq_means = np.bincount(idx, weights=values * values * weights, minlength=size) / (
+        np.maximum(totals, _EPS)
     )
-
-
-def _agreement_penalty(values: list[float], weights: list[float], scale: float) -> float:
-    if len(values) < 2:
-        return 1.0
-    variance = _weighted_variance(values, weights, _weighted_mean(values, weights))
-    return 1.0 / (1.0 + scale * variance)
+    # The identity can go slightly negative in floating point; clamp.
+    return np.maximum(sq_means - means * means, 0.0)
 
 
 def _fuse_links(beliefs: list[Belief]) -> dict[str, LinkState]:
-    all_link_ids: set[str] = set()
+    # Flatten every contribution once; all per-link reductions become bincounts.
+    link_ids: list[str] = []
+    attenuations: list[float] = []
+    motion_probs: list[float] = []
+    precisions: list[float] = []
     for belief in beliefs:
-        all_link_ids.update(belief.links.keys())
-
-    fused: dict[str, LinkState] = {}
-    for link_id in all_link_ids:
-        attenuations: list[float] = []
-        motion_probs: list[float] = []
-        precisions: list[float] = []
-
-        for belief in beliefs:
-            link = belief.links.get(link_id)
-            if link is None:
-                continue
-            precision = _precision_from_confidence(link.confidence)
+        for link_id, link in belief.links.items():
+            link_ids.append(link_id)
             attenuations.append(link.attenuation)
             motion_probs.append(1.0 if link.motion else 0.0)
-            precisions.append(precision)
-
-        if not precisions:
-            continue
-
-        total_precision = sum(precisions)
-        avg_attenuation = _weighted_mean(attenuations, precisions)
-        avg_motion_prob = _weighted_mean(motion_probs, precisions)
-        base_confidence = total_precision / (1.0 + total_precision)
-        confidence = base_confidence * _agreement_penalty(attenuations, precisions, scale=2.5)
-
-        fused[link_id] = LinkState(
-            attenuation=max(avg_attenuation, 0.0),
-            motion=avg_motion_prob >= 0.5,
-            confidence=_clamp01(confidence),
+            precisions.append(_precision_from_confidence(link.confidence))
+
+    if not link_ids:
+        return {}
+
+    index = _index_ids(link_ids)
+    m = len(index)
+    idx = np.array([index[link_id] for link_id in link_ids], dtype=np.intp)
+    att = np.array(attenuations)
+    motion = np.array(motion_probs)
+    prec = np.array(precisions)
+
+    avg_att, total_prec = _weighted_group_means(idx, att, prec, m)
+    avg_motion, _ = _weighted_group_means(idx, motion, prec, m)
+    base_confidence = total_prec / (1.0 + total_prec)
+
+    # Agreement penalty: weighted attenuation variance shrinks confidence when
+    # contributors disagree; singleton links keep penalty 1.0.
+    counts = np.bincount(idx, minlength=m)
+    variance = _weighted_group_variances(idx, att, prec, avg_att, total_prec, m)
+    penalty = np.where(counts >= 2, 1.0 / (1.0 + 2.5 * variance), 1.0)
+    confidence = base_confidence * penalty
+
+    return {
+        link_id: LinkState(
+            attenuation=max(float(avg_att[i]), 0.0),
+            motion=bool(avg_motion[i] >= 0.5),
+            confidence=_clamp01(float(confidence[i])),
         )
-    return fused
-
-
-def _device_confidence(belief: Belief, device_id: str, device: DeviceState) -> float:
-    link = belief.links.get(device_id)
-    if link is not None:
-        confidence = link.confidence
-    else:
-        confidence = 0.35
-
-    distance = device.estimated_distance
-    if distance is not None and distance > 0:
-        distance_confidence = 1.0 / (1.0 + (distance / 15.0))
-        confidence = 0.6 * confidence + 0.4 * distance_confidence
-
-    if device.moving:
-        confidence *= 0.9
-
-    return min(max(confidence, 0.05), 0.99)
+        for link_id, i in index.items()
+    }
 
 
 def _fuse_devices(beliefs: list[Belief]) -> dict[str, DeviceState]:
-    all_device_ids: set[str] = set()
+    # Harvest raw fields only; the confidence model runs vectorized below.
+    device_ids: list[str] = []
+    rssi_values: list[float] = []
+    motion_values: list[float] = []
+    distance_values: list[float] = []
+    link_confidences: list[float] = []
     for belief in beliefs:
-        all_device_ids.update(belief.devices.keys())
-
-    fused: dict[str, DeviceState] = {}
-    for device_id in all_device_ids:
-        rssi_values: list[float] = []
-        rssi_weights: list[float] = []
-        distance_values: list[float] = []
-        distance_weights: list[float] = []
-        motion_values: list[float] = []
-        motion_weights: list[float] = []
-
-        for belief in beliefs:
-            device = belief.devices.get(device_id)
-            if device is None:
-                continue
-            precision = _precision_from_confidence(
-                _device_confidence(belief, device_id, device),
-            )
+        links = belief.links
+        for device_id, device in belief.devices.items():
+            link = links.get(device_id)
+            device_ids.append(device_id)
             rssi_values.append(device.rssi)
-            rssi_weights.append(precision)
             motion_values.append(1.0 if device.moving else 0.0)
-            motion_weights.append(precision)
-
-            if device.estimated_distance is not None and device.estimated_distance > 0:
-                # Long-range RF distances are less reliable; down-weight by squared range.
-                range_scale = max(device.estimated_distance, 1.0) ** 2
-                distance_values.append(device.estimated_distance)
-                distance_weights.append(precision / range_scale)
-
-        if not rssi_weights:
-            continue
-
-        avg_rssi = _weighted_mean(rssi_values, rssi_weights)
-        avg_motion_prob = _weighted_mean(motion_values, motion_weights)
-        avg_distance = (
-            _weighted_mean(distance_values, distance_weights) if distance_weights else None
+            distance_values.append(device.estimated_distance or 0.0)
+            link_confidences.append(link.confidence if link is not None else 0.35)
+
+    if not device_ids:
+        return {}
+
+    index = _index_ids(device_ids)
+    m = len(index)
+    idx = np.array([index[device_id] for device_id in device_ids], dtype=np.intp)
+    moving = np.array(motion_values)
+    dist = np.array(distance_values)
+    ranged = dist > 0
+
+    # Per-observation confidence: start from the link confidence (0.35 when
+    # no link exists), blend in 1/(1 + d/15) for ranged devices, dampen
+    # moving devices by 0.9, clamp to [0.05, 0.99], then map to precision.
+    conf = np.array(link_confidences)
+    conf = np.where(ranged, 0.6 * conf + 0.4 / (1.0 + dist / 15.0), conf)
+    conf = np.where(moving > 0, conf * 0.9, conf)
+    conf = np.clip(conf, 0.05, 0.99)
+    prec = 1.0 / (((1.0 - conf) / conf) + _EPS)
+
+    avg_rssi, _ = _weighted_group_means(idx, np.array(rssi_values), prec, m)
+    avg_motion, _ = _weighted_group_means(idx, moving, prec, m)
+
+    # Long-range RF distances are less reliable; down-weight by squared range.
+    dist_w = np.where(ranged, prec / np.maximum(dist, 1.0) ** 2, 0.0)
+    distance_counts = np.bincount(idx, weights=ranged.astype(np.float64), minlength=m)
+    avg_distance, _ = _weighted_group_means(idx, dist, dist_w, m)
+
+    return {
+        device_id: DeviceState(
+            rssi=float(avg_rssi[i]),
+            estimated_distance=float(avg_distance[i]) if distance_counts[i] else None,
+            moving=bool(avg_motion[i] >= 0.5),
         )
-
-        fused[device_id] = DeviceState(
-            rssi=avg_rssi,
-            estimated_distance=avg_distance,
-            moving=avg_motion_prob >= 0.5,
-        )
-
-    return fused
+        for device_id, i in index.items()
+    }
 
 
 def _zone_confidence(zone: ZoneBelief) -> float:
@@ -169,31 +183,32 @@ def _zone_confidence(zone: ZoneBelief) -> float:
 
 
 def _fuse_zones(beliefs: list[Belief]) -> dict[str, ZoneBelief]:
-    all_zone_ids: set[str] = set()
+    zone_ids: list[str] = []
+    occupied_values: list[float] = []
+    motion_values: list[float] = []
+    precisions: list[float] = []
     for belief in beliefs:
-        all_zone_ids.update(belief.zones.keys())
-
-    fused: dict[str, ZoneBelief] = {}
-    for zone_id in all_zone_ids:
-        occupied_values: list[float] = []
-        motion_values: list[float] = []
-        weights: list[float] = []
-
-        for belief in beliefs:
-            zone = belief.zones.get(zone_id)
-            if zone is None:
-                continue
-            precision = _precision_from_confidence(_zone_confidence(zone))
+        for zone_id, zone in belief.zones.items():
+            zone_ids.append(zone_id)
             occupied_values.append(zone.occupied)
             motion_values.append(zone.motion)
-            weights.append(precision)
+            precisions.append(_precision_from_confidence(_zone_confidence(zone)))
 
-        if not weights:
-            continue
+    if not zone_ids:
+        return {}
 
-        fused[zone_id] = ZoneBelief(
-            occupied=_clamp01(_weighted_mean(occupied_values, weights)),
-            motion=_clamp01(_weighted_mean(motion_values, weights)),
-        )
+    index = _index_ids(zone_ids)
+    m = len(index)
+    idx = np.array([index[zone_id] for zone_id in zone_ids], dtype=np.intp)
+    prec = np.array(precisions)
 
-    return fused
+    avg_occupied, _ = _weighted_group_means(idx, np.array(occupied_values), prec, m)
+    avg_motion, _ = _weighted_group_means(idx, np.array(motion_values), prec, m)
+
+    return {
+        zone_id: ZoneBelief(
+            occupied=_clamp01(float(avg_occupied[i])),
+            motion=_clamp01(float(avg_motion[i])),
+        )
+        for zone_id, i in index.items()
+    }
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import defaultdict
 from dataclasses import dataclass
 
 
@@ -26,6 +27,9 @@ class SignalGraph:
     def __init__(self) -> None:
         self._vertices: dict[str, Vertex] = {}
         self._edges: dict[tuple[str, str], Edge] = {}
+        # Adjacency indices so per-vertex queries cost O(deg) not O(E).
+        self._out_adj: dict[str, set[str]] = defaultdict(set)
+        self._in_adj: dict[str, set[str]] = defaultdict(set)
 
     def add_vertex(self, vertex: Vertex) -> None:
         self._vertices[vertex.id] = vertex
@@ -35,6 +39,8 @@ class SignalGraph:
 
     def add_edge(self, edge: Edge) -> None:
         self._edges[(edge.source, edge.target)] = edge
+        self._out_adj[edge.source].add(edge.target)
+        self._in_adj[edge.target].add(edge.source)
 
     def update_edge(self, source: str, target: str, **kwargs) -> None:
         key = (source, target)
@@ -49,19 +55,16 @@ class SignalGraph:
         return self._edges.get((source, target))
 
     def get_neighbors(self, vertex_id: str) -> list[str]:
-        neighbors: set[str] = set()
-        for src, tgt in self._edges:
-            if src == vertex_id:
-                neighbors.add(tgt)
-            elif tgt == vertex_id:
-                neighbors.add(src)
-        return list(neighbors)
+        return list(self._out_adj[vertex_id] | self._in_adj[vertex_id])
 
     def get_edges_for(self, vertex_id: str) -> list[Edge]:
-        return [
-            e for (src, tgt), e in self._edges.items()
-            if src == vertex_id or tgt == vertex_id
-        ]
+        edges = [self._edges[(vertex_id, tgt)] for tgt in self._out_adj[vertex_id]]
+        edges.extend(
+            self._edges[(src, vertex_id)]
+            for src in self._in_adj[vertex_id]
+            if src != vertex_id  # self-loops are already in the outgoing list
+        )
+        return edges
 
     def get_all_edges(self) -> list[Edge]:
         return list(self._edges.values())
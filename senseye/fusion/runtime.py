@@ -3,10 +3,11 @@
 from __future__ import annotations
 
 from collections import defaultdict
+from statistics import median
 
 import numpy as np
 
-from senseye.fusion.tomography import LinkMeasurement, reconstruct
+from senseye.fusion.tomography import reconstruct_arrays
 from senseye.fusion.trilateration import trilaterate
 from senseye.node.belief import Belief
 
@@ -42,8 +43,12 @@ def estimate_device_positions(
         for anchor_id, samples in anchor_to_samples.items():
             if not samples:
                 continue
-            # Median is robust to occasional RSSI distance outliers.
-            anchor_distances[anchor_id] = float(np.median(np.array(samples)))
+            # Median is robust to occasional RSSI distance outliers; the
+            # sample lists are tiny, so pure-Python beats the ndarray round
+            # trip np.median would pay.
+            anchor_distances[anchor_id] = (
+                samples[0] if len(samples) == 1 else float(median(samples))
+            )
 
         observations = [
             (node_positions[anchor_id], distance)
@@ -65,7 +70,13 @@ def reconstruct_attenuation_grid(
     resolution: float = 0.5,
 ) -> np.ndarray:
     """Reconstruct an attenuation image from link beliefs with known endpoints."""
-    pair_to_stats: dict[tuple[str, str], list[float]] = {}
+    # Gather flat (pair id, attenuation, confidence) rows; the per-pair
+    # weighted averaging happens in bincount passes instead of four dict
+    # updates per link.
+    pair_index: dict[tuple[str, str], int] = {}
+    pair_ids: list[int] = []
+    attenuations: list[float] = []
+    confidences: list[float] = []
     for belief in beliefs:
         src = belief.node_id
         if src not in node_positions:
@@ -76,28 +87,33 @@ def reconstruct_attenuation_grid(
             if link.attenuation <= 0:
                 continue
             pair = (src, target) if src <= target else (target, src)
-            weight = max(link.confidence, 0.05)
-            stats = pair_to_stats.setdefault(pair, [0.0, 0.0, 0.0, 0.0])
-            # [weighted attenuation sum, weight sum, confidence sum, count]
-            stats[0] += link.attenuation * weight
-            stats[1] += weight
-            stats[2] += link.confidence
-            stats[3] += 1.0
+            pair_ids.append(pair_index.setdefault(pair, len(pair_index)))
+            attenuations.append(link.attenuation)
+            confidences.append(link.confidence)
 
-    if not pair_to_stats:
+    if not pair_ids:
         return np.array([[]])
 
-    measurements = [
-        LinkMeasurement(
-            p1=node_positions[src],
-            p2=node_positions[target],
-            excess_attenuation=(stats[0] / max(stats[1], 1e-6)),
-            confidence=min(max(stats[2] / max(stats[3], 1.0), 0.01), 1.0),
-        )
-        for (src, target), stats in pair_to_stats.items()
-    ]
-    return reconstruct(
-        links=measurements,
+    m = len(pair_index)
+    ids = np.array(pair_ids, dtype=np.intp)
+    att = np.array(attenuations)
+    conf_rows = np.array(confidences)
+    weight = np.maximum(conf_rows, 0.05)
+
+    sum_aw = np.bincount(ids, weights=att * weight, minlength=m)
+    sum_w = np.bincount(ids, weights=weight, minlength=m)
+    sum_c = np.bincount(ids, weights=conf_rows, minlength=m)
+    counts = np.bincount(ids, minlength=m)
+
+    p1 = np.array([node_positions[src] for src, _ in pair_index], dtype=np.float64)
+    p2 = np.array([node_positions[target] for _, target in pair_index], dtype=np.float64)
+    excess = sum_aw / np.maximum(sum_w, 1e-6)
+    conf = np.clip(sum_c / np.maximum(counts, 1.0), 0.01, 1.0)
+    return reconstruct_arrays(
+        p1,
+        p2,
+        excess,
+        conf,
         bounds=bounds,
         resolution=resolution,
     )
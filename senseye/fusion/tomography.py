@@ -15,33 +15,37 @@ class LinkMeasurement:
     confidence: float = 1.0
 
 
-def _point_to_segment_distance(
-    px: float,
-    py: float,
-    x1: float,
-    y1: float,
-    x2: float,
-    y2: float,
-) -> float:
-    """Distance from point (px, py) to segment (x1, y1) -> (x2, y2)."""
-    dx = x2 - x1
-    dy = y2 - y1
-    seg_len_sq = (dx * dx) + (dy * dy)
-    if seg_len_sq <= 0:
-        return float(np.hypot(px - x1, py - y1))
-
-    t = ((px - x1) * dx + (py - y1) * dy) / seg_len_sq
-    t = max(0.0, min(1.0, t))
-    proj_x = x1 + (t * dx)
-    proj_y = y1 + (t * dy)
-    return float(np.hypot(px - proj_x, py - proj_y))
+def _segment_distance_tensor(
+    XX: np.ndarray,
+    YY: np.ndarray,
+    P1: np.ndarray,
+    P2: np.ndarray,
+) -> np.ndarray:
+    """(L, rows, cols) distances from every cell center to each segment.
+
+    Degenerate segments (coincident endpoints) clamp t to 0 and fall back to
+    plain point distance.
+    """
+    d = P2 - P1
+    seg_len_sq = (d**2).sum(axis=1)
+    safe_len_sq = np.where(seg_len_sq > 0, seg_len_sq, 1.0)
+
+    dx = d[:, 0, None, None]
+    dy = d[:, 1, None, None]
+    rx = XX[None, :, :] - P1[:, 0, None, None]
+    ry = YY[None, :, :] - P1[:, 1, None, None]
+    t = np.clip((rx * dx + ry * dy) / safe_len_sq[:, None, None], 0.0, 1.0)
+    # Plain sqrt-of-squares; hypot's overflow-safe rescaling costs ~2x for
+    # nothing at room-scale magnitudes.
+    ex = rx - t * dx
+    ey = ry - t * dy
+    return np.sqrt(ex * ex + ey * ey)
 
 
 def _adaptive_alpha(A: np.ndarray, row_weights: np.ndarray, n_cells: int) -> float:
     if A.size == 0:
         return 1.0
-    weighted_A = A * np.sqrt(row_weights)[:, None]
-    ata = weighted_A.T @ weighted_A
+    ata = np.einsum("i,ij,ik->jk", row_weights, A, A)
     ata_reg = ata + (1e-6 * np.eye(ata.shape[0]))
     try:
         cond = float(np.linalg.cond(ata_reg))
@@ -62,6 +66,41 @@ def reconstruct(
     regularization: float | None = None,
 ) -> np.ndarray:
     """Reconstruct a 2D attenuation field with confidence-weighted ridge regression."""
+    if links:
+        p1 = np.array([link.p1 for link in links], dtype=np.float64)
+        p2 = np.array([link.p2 for link in links], dtype=np.float64)
+        excess = np.array([link.excess_attenuation for link in links], dtype=np.float64)
+        conf = np.array([link.confidence for link in links], dtype=np.float64)
+    else:
+        p1 = p2 = np.empty((0, 2))
+        excess = conf = np.empty(0)
+    return reconstruct_arrays(
+        p1,
+        p2,
+        excess,
+        conf,
+        bounds,
+        resolution=resolution,
+        influence_radius=influence_radius,
+        regularization=regularization,
+    )
+
+
+def reconstruct_arrays(
+    p1: np.ndarray,
+    p2: np.ndarray,
+    excess: np.ndarray,
+    conf: np.ndarray,
+    bounds: tuple[float, float, float, float],
+    resolution: float = 0.5,
+    influence_radius: float = 0.5,
+    regularization: float | None = None,
+) -> np.ndarray:
+    """Array-native reconstruct: link endpoints and stats as (L, 2)/(L,) arrays.
+
+    Bulk callers that already hold columnar data use this directly and skip
+    the per-link dataclass round trip.
+    """
     x_min, y_min, x_max, y_max = bounds
     if x_max <= x_min or y_max <= y_min or resolution <= 0:
         return np.array([[]])
@@ -69,67 +108,57 @@ def reconstruct(
     n_cols = max(1, int(np.ceil((x_max - x_min) / resolution)))
     n_rows = max(1, int(np.ceil((y_max - y_min) / resolution)))
 
-    if not links:
+    if p1.shape[0] == 0:
         return np.zeros((n_rows, n_cols))
 
     xs = x_min + ((np.arange(n_cols) + 0.5) * resolution)
     ys = y_min + ((np.arange(n_rows) + 0.5) * resolution)
     n_cells = n_rows * n_cols
 
-    cell_coords = [(float(ys[r]), float(xs[c])) for r in range(n_rows) for c in range(n_cols)]
-
-    rows: list[np.ndarray] = []
-    targets: list[float] = []
-    row_weights: list[float] = []
+    # float32 for the (L, rows, cols) tensor and kernel rows: meter-scale
+    # geometry is nowhere near f32 precision limits and the working set is
+    # the memory-bandwidth hot spot of this function.
+    XX, YY = np.meshgrid(xs.astype(np.float32), ys.astype(np.float32))
 
+    # All links in one (L, rows, cols) broadcast; cells within the influence
+    # radius are necessarily inside the old expanded-bbox prefilter.
     kernel_sigma = max(influence_radius / 2.0, 1e-3)
-    for link in links:
-        x1, y1 = link.p1
-        x2, y2 = link.p2
-
-        row = np.zeros(n_cells, dtype=np.float64)
-        lx_min = min(x1, x2) - influence_radius
-        lx_max = max(x1, x2) + influence_radius
-        ly_min = min(y1, y2) - influence_radius
-        ly_max = max(y1, y2) + influence_radius
-
-        for idx, (cy, cx) in enumerate(cell_coords):
-            if not (lx_min <= cx <= lx_max and ly_min <= cy <= ly_max):
-                continue
-            dist = _point_to_segment_distance(cx, cy, x1, y1, x2, y2)
-            if dist > influence_radius:
-                continue
-            row[idx] = np.exp(-(dist**2) / (2.0 * (kernel_sigma**2)))
-
-        row_sum = float(np.sum(row))
-        if row_sum <= 1e-6:
-            continue
-        row /= row_sum
-        rows.append(row)
-        targets.append(float(link.excess_attenuation))
-        # Inverse-variance weighting consistent with consensus fusion:
-        # variance = (1-c)/c, so precision (weight) = c/(1-c)
-        c = min(max(float(link.confidence), 0.01), 0.99)
-        row_weights.append(c / (1.0 - c))
-
-    if not rows:
+    dist = _segment_distance_tensor(XX, YY, p1.astype(np.float32), p2.astype(np.float32))
+    inside = dist <= influence_radius
+    all_rows = np.where(
+        inside, np.exp(-(dist**2) / np.float32(2.0 * (kernel_sigma**2))), np.float32(0.0)
+    ).reshape(p1.shape[0], n_cells)
+
+    row_sums = all_rows.sum(axis=1)
+    keep = row_sums > 1e-6
+    if not keep.any():
         return np.zeros((n_rows, n_cols))
 
-    A = np.vstack(rows)
-    b = np.array(targets, dtype=np.float64)
-    w = np.array(row_weights, dtype=np.float64)
+    # Back to f64 for the normal-equation algebra; A is small once reduced.
+    A = (all_rows[keep] / row_sums[keep, None]).astype(np.float64)
+    b = excess[keep]
+    # Inverse-variance weighting consistent with consensus fusion:
+    # variance = (1-c)/c, so precision (weight) = c/(1-c)
+    c = np.clip(conf[keep], 0.01, 0.99)
+    w = c / (1.0 - c)
 
     alpha = regularization if regularization is not None else _adaptive_alpha(A, w, n_cells)
-    weighted_A = A * np.sqrt(w)[:, None]
-    weighted_b = b * np.sqrt(w)
-
-    lhs = weighted_A.T @ weighted_A + (alpha * np.eye(n_cells))
-    rhs = weighted_A.T @ weighted_b
+    sqrt_w = np.sqrt(w)
 
+    # Ridge identity: (A'A + aI)^-1 A'b == A'(AA' + aI)^-1 b. A is short-fat
+    # (links << cells), so solve the L x L dual system instead of forming the
+    # n_cells x n_cells normal equations. einsum contractions fold the row
+    # weights in without materializing a sqrt(w)-scaled copy of A.
+    n_links = A.shape[0]
     try:
-        x = np.linalg.solve(lhs, rhs)
+        if n_links < n_cells:
+            gram = (A @ A.T) * np.outer(sqrt_w, sqrt_w) + (alpha * np.eye(n_links))
+            x = A.T @ (sqrt_w * np.linalg.solve(gram, sqrt_w * b))
+        else:
+            lhs = np.einsum("i,ij,ik->jk", w, A, A) + (alpha * np.eye(n_cells))
+            x = np.linalg.solve(lhs, np.einsum("i,ij,i->j", w, A, b))
     except np.linalg.LinAlgError:
-        x, *_ = np.linalg.lstsq(weighted_A, weighted_b, rcond=None)
+        x, *_ = np.linalg.lstsq(A * sqrt_w[:, None], b * sqrt_w, rcond=None)
 
     grid = x.reshape((n_rows, n_cols))
     grid[grid < 0] = 0.0
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from itertools import combinations
+import math
 
 import numpy as np
 
@@ -52,88 +52,77 @@ def _solve_position(
     max_iters: int,
     tolerance: float,
 ) -> tuple[tuple[float, float], np.ndarray, np.ndarray]:
+    # Anchor geometry, measured ranges, and the sigma-derived weights are
+    # constant across iterations; build them once instead of per pass.
+    anchors = np.array([obs[0] for obs in observations], dtype=np.float64)
+    measured = np.array([obs[1] for obs in observations], dtype=np.float64)
+    sigmas = np.maximum(0.35, 0.08 * measured + 0.2)
+    base_w = 1.0 / (sigmas * sigmas)
+    cutoffs = 2.5 * sigmas
+
+    prev_cost: float | None = None
     for _ in range(max_iters):
-        jacobian_rows: list[list[float]] = []
-        residuals: list[float] = []
-        row_weights: list[float] = []
-        base_weights: list[float] = []
-
-        for (ax, ay), measured_distance in observations:
-            dx = x - ax
-            dy = y - ay
-            predicted_distance = max(float(np.hypot(dx, dy)), _EPS)
-            residual = predicted_distance - measured_distance
-
-            sigma = _range_sigma(measured_distance)
-            base_weight = 1.0 / (sigma * sigma)
-            base_weights.append(base_weight)
-
-            # Tukey biweight strongly suppresses gross outliers.
-            cutoff = 2.5 * sigma
-            abs_residual = abs(residual)
-            if abs_residual >= cutoff:
-                robust_weight = 0.0
-            else:
-                ratio = abs_residual / cutoff
-                robust_weight = (1.0 - (ratio * ratio)) ** 2
-            weight = base_weight * robust_weight
-
-            jacobian_rows.append([dx / predicted_distance, dy / predicted_distance])
-            residuals.append(residual)
-            row_weights.append(weight)
-
-        J = np.array(jacobian_rows, dtype=np.float64)
-        r = np.array(residuals, dtype=np.float64)
-        w = np.array(row_weights, dtype=np.float64)
+        diff = np.array([x, y]) - anchors
+        # np.sqrt of the explicit sum: hypot's overflow-safe rescaling is
+        # wasted on room-scale coordinates.
+        predicted = np.maximum(np.sqrt(diff[:, 0] ** 2 + diff[:, 1] ** 2), _EPS)
+        r = predicted - measured
+
+        # Tukey biweight strongly suppresses gross outliers.
+        ratio = np.minimum(np.abs(r) / cutoffs, 1.0)
+        w = base_w * (1.0 - ratio * ratio) ** 2
         if np.max(w) <= 1e-12:
-            w = np.array(base_weights, dtype=np.float64)
-        sqrt_w = np.sqrt(w)
-
-        Jw = J * sqrt_w[:, None]
-        rw = r * sqrt_w
+            w = base_w
 
-        lhs = Jw.T @ Jw
-        rhs = Jw.T @ rw
-
-        try:
-            delta = np.linalg.solve(lhs + (1e-6 * np.eye(2)), rhs)
-        except np.linalg.LinAlgError:
+        # Well-seeded calls (e.g. the inlier refit) converge in a step or
+        # two; stop as soon as the weighted cost stops moving.
+        cost = float(np.dot(w, r * r))
+        if prev_cost is not None and abs(prev_cost - cost) < 1e-3 * max(prev_cost, _EPS):
+            break
+        prev_cost = cost
+
+        J = diff / predicted[:, None]
+
+        # Weighted normal equations without the sqrt(w)-scaled copies.
+        lhs = np.einsum("i,ij,ik->jk", w, J, J)
+        rhs = np.einsum("i,ij,i->j", w, J, r)
+
+        # The system is always 2x2; the closed form skips LAPACK dispatch,
+        # which costs far more than the handful of flops involved.
+        a = float(lhs[0, 0]) + 1e-6
+        d = float(lhs[1, 1]) + 1e-6
+        b = float(lhs[0, 1])
+        p, q = float(rhs[0]), float(rhs[1])
+        det = a * d - b * b
+        if abs(det) > 1e-18:
+            delta_x = (d * p - b * q) / det
+            delta_y = (a * q - b * p) / det
+        else:
             delta = np.linalg.pinv(lhs) @ rhs
+            delta_x, delta_y = float(delta[0]), float(delta[1])
 
-        x -= float(delta[0])
-        y -= float(delta[1])
+        x -= delta_x
+        y -= delta_y
 
-        if float(np.linalg.norm(delta)) < tolerance:
+        if math.hypot(delta_x, delta_y) < tolerance:
             break
 
-    final_residuals = []
-    normalized_residuals = []
-    for (ax, ay), measured_distance in observations:
-        predicted_distance = float(np.hypot(x - ax, y - ay))
-        residual = predicted_distance - measured_distance
-        final_residuals.append(residual)
-        normalized_residuals.append(abs(residual) / _range_sigma(measured_distance))
-
-    return (
-        (x, y),
-        np.array(final_residuals, dtype=np.float64),
-        np.array(normalized_residuals, dtype=np.float64),
-    )
+    diff = np.array([x, y]) - anchors
+    final_residuals = np.sqrt(diff[:, 0] ** 2 + diff[:, 1] ** 2) - measured
+    return (x, y), final_residuals, np.abs(final_residuals) / sigmas
 
 
 def _residual_arrays(
     position: tuple[float, float],
-    observations: list[RangeObservation],
+    anchors: np.ndarray,
+    distances: np.ndarray,
+    sigmas: np.ndarray,
 ) -> tuple[np.ndarray, np.ndarray]:
     x, y = position
-    residuals: list[float] = []
-    normalized_residuals: list[float] = []
-    for (ax, ay), measured_distance in observations:
-        predicted_distance = float(np.hypot(x - ax, y - ay))
-        residual = predicted_distance - measured_distance
-        residuals.append(residual)
-        normalized_residuals.append(abs(residual) / _range_sigma(measured_distance))
-    return np.array(residuals, dtype=np.float64), np.array(normalized_residuals, dtype=np.float64)
+    dx = anchors[:, 0] - x
+    dy = anchors[:, 1] - y
+    residuals = np.sqrt(dx * dx + dy * dy) - distances
+    return residuals, np.abs(residuals) / sigmas
 
 
 def trilaterate(
@@ -154,62 +143,82 @@ def trilaterate(
     if len(valid) < 3:
         return None
 
-    candidate_index_sets: set[tuple[int, ...]] = {tuple(range(len(valid)))}
-    if len(valid) > 3:
-        indices = tuple(range(len(valid)))
-        candidate_index_sets.update(combinations(indices, len(valid) - 1))
-        if len(valid) <= 6:
-            candidate_index_sets.update(combinations(indices, 3))
+    # The Tukey biweight inside the solver already suppresses gross outliers,
+    # so one robust fit per seed replaces the old blanket leave-one-out/triple
+    # subset enumeration (dozens of solves for n=6). Suspects flagged by that
+    # first fit still get targeted leave-one-out refits below, which recovers
+    # the case where a gross outlier corrupts the linearized seed itself.
+    valid_anchors = np.array([obs[0] for obs in valid], dtype=np.float64)
+    valid_dists = np.array([obs[1] for obs in valid], dtype=np.float64)
+    valid_sigmas = np.maximum(0.35, 0.08 * valid_dists + 0.2)
+    centroid = valid_anchors.mean(axis=0)
+    seeds = [
+        _initial_guess(valid),
+        (float(centroid[0]), float(centroid[1])),
+    ]
 
     best_position: tuple[float, float] | None = None
     best_norm_residuals: np.ndarray | None = None
     best_score = float("inf")
     best_inlier_count = -1
 
-    for index_set in sorted(candidate_index_sets):
-        subset = [valid[idx] for idx in index_set]
-        anchors = np.array([obs[0] for obs in subset], dtype=np.float64)
-        centroid = anchors.mean(axis=0)
-        seeds = [
-            _initial_guess(subset),
-            (float(centroid[0]), float(centroid[1])),
-        ]
-
-        for seed_x, seed_y in seeds:
-            (x, y), _, _ = _solve_position(
-                subset,
-                seed_x,
-                seed_y,
-                max_iters=max_iters,
-                tolerance=tolerance,
-            )
-            _, norm_residuals = _residual_arrays((x, y), valid)
-            inlier_count = int(np.sum(norm_residuals <= 2.5))
-            score = float(np.mean(np.minimum(norm_residuals**2, 9.0)))
-            if (
-                inlier_count > best_inlier_count
-                or (inlier_count == best_inlier_count and score < best_score)
-            ):
-                best_inlier_count = inlier_count
-                best_score = score
-                best_position = (x, y)
-                best_norm_residuals = norm_residuals
+    def _consider(subset: list[RangeObservation], seed_x: float, seed_y: float) -> None:
+        nonlocal best_position, best_norm_residuals, best_score, best_inlier_count
+        (x, y), _, _ = _solve_position(
+            subset,
+            seed_x,
+            seed_y,
+            max_iters=max_iters,
+            tolerance=tolerance,
+        )
+        _, norm_residuals = _residual_arrays((x, y), valid_anchors, valid_dists, valid_sigmas)
+        inlier_count = int(np.sum(norm_residuals <= 2.5))
+        score = float(np.mean(np.minimum(norm_residuals**2, 9.0)))
+        if (
+            inlier_count > best_inlier_count
+            or (inlier_count == best_inlier_count and score < best_score)
+        ):
+            best_inlier_count = inlier_count
+            best_score = score
+            best_position = (x, y)
+            best_norm_residuals = norm_residuals
+
+    for seed_x, seed_y in seeds:
+        _consider(valid, seed_x, seed_y)
+
+    if (
+        best_norm_residuals is not None
+        and best_inlier_count < len(valid)
+        and len(valid) > 3
+    ):
+        suspects = np.flatnonzero(best_norm_residuals > 2.5)
+        if suspects.size == 0:
+            suspects = np.array([int(np.argmax(best_norm_residuals))])
+        for drop in suspects.tolist():
+            subset = [obs for idx, obs in enumerate(valid) if idx != drop]
+            _consider(subset, *_initial_guess(subset))
 
     if best_position is None or best_norm_residuals is None:
         return None
 
-    inliers = [obs for obs, keep in zip(valid, best_norm_residuals <= 2.5) if bool(keep)]
-    solve_set = inliers if len(inliers) >= 3 else valid
-    (x, y), _, _ = _solve_position(
+    keep = best_norm_residuals <= 2.5
+    if int(np.sum(keep)) >= 3:
+        solve_set = [obs for obs, kept in zip(valid, keep) if bool(kept)]
+        solve_sigmas = valid_sigmas[keep]
+    else:
+        solve_set = valid
+        solve_sigmas = valid_sigmas
+    # The refit starts from an already-converged position; a handful of
+    # iterations is enough for the inlier-only polish.
+    (x, y), residuals, _ = _solve_position(
         solve_set,
         best_position[0],
         best_position[1],
-        max_iters=max_iters,
+        max_iters=min(max_iters, 4),
         tolerance=tolerance,
     )
-    residuals, _ = _residual_arrays((x, y), solve_set)
 
-    weights = np.array([1.0 / (_range_sigma(distance) ** 2) for _, distance in solve_set])
+    weights = 1.0 / (solve_sigmas**2)
     rmse = float(np.sqrt(np.sum(weights * (residuals**2)) / max(np.sum(weights), _EPS)))
 
     # Sanity gate for divergent solutions.
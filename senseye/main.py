@@ -4,44 +4,37 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import dataclasses
 import logging
 import signal
 import time
+from collections import deque
 from collections.abc import Mapping
+from functools import partial
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-from senseye.calibration import calibrate_floorplan
 from senseye.config import (
     AcousticMode,
     NodeRole,
     SenseyeConfig,
-    _parse_acoustic_mode,
     apply_overrides,
     load_config_file,
-    parse_acoustic_interval,
-)
-from senseye.fusion.consensus import fuse_beliefs
-from senseye.fusion.runtime import estimate_device_positions, reconstruct_attenuation_grid
-from senseye.mapping.dynamic.state import WorldState, update_world
-from senseye.mapping.static.floorplan import FloorPlan
-from senseye.mapping.static.floorplan import load as load_floorplan
-from senseye.mapping.static.floorplan import save as save_floorplan
-from senseye.mapping.static.topology import update_topology
-from senseye.node.acoustic import (
-    DEFAULT_SAMPLE_RATE,
-    SPEED_OF_SOUND,
-    echo_profile,
-    generate_chirp,
-    get_chirp_params,
-    listen_for_chirp,
-    play_chirp,
+    parse_acoustic,
 )
 from senseye.node.belief import Belief
-from senseye.node.filter import FilterBank
-from senseye.node.inference import RssiHistory, infer
-from senseye.node.peer import PeerMesh
 from senseye.node.scanner import Observation, SignalType, scan_all
 
+# The sensing/fusion subtree (numpy, zeroconf, sounddevice, ...) dominates
+# import time; it is pulled in lazily by run() and the helpers below so that
+# arg parsing, --help and config errors never pay for it.
+if TYPE_CHECKING:
+    from senseye.mapping.dynamic.state import WorldState
+    from senseye.mapping.static.floorplan import FloorPlan
+    from senseye.node.filter import FilterBank
+    from senseye.node.inference import RssiHistory
+    from senseye.node.peer import PeerMesh
+
 log = logging.getLogger("senseye")
 
 _CALIBRATION_SCANS = 3
@@ -54,26 +47,60 @@ _ACOUSTIC_PING_DELAY_S = 0.2
 _ACOUSTIC_MIN_SNR = 3.0
 _MAX_ACOUSTIC_TOF_S = 0.2
 _MAX_MOTION_EVENTS = 500
+_MAX_SCAN_INTERVAL = 60.0
+_MAX_BELIEF_GAP = 15.0
+# Mesh payload bytes per cycle above which BLE scanning is shortened to keep
+# the shared radio available for the Wi-Fi backbone.
+_BLE_COEX_BYTES = 16384
+_BLE_COEX_SCALE = 0.25
 
 
 def _command(config: SenseyeConfig) -> str | None:
     return getattr(config, "_command", None)
 
 
+def _belief_fingerprint(devices: dict, links: dict) -> tuple:
+    """Cheap structural digest of a belief for change detection.
+
+    RSSI rounds to whole dB and attenuation to 0.1 dB so measurement jitter
+    does not read as change.
+    """
+    return (
+        tuple(sorted(
+            (device_id, round(state.rssi), state.moving)
+            for device_id, state in devices.items()
+        )),
+        tuple(sorted(
+            (link_id, round(state.attenuation, 1), state.motion)
+            for link_id, state in links.items()
+        )),
+    )
+
+
 def _apply_kalman(
     observations: list[Observation],
     filter_bank: FilterBank,
     node_id: str,
 ) -> list[Observation]:
+    if not observations:
+        return []
+
+    import numpy as np
+
+    # One vectorized filter pass for the whole cycle instead of a Kalman
+    # update per observation.
+    device_ids = [obs.device_id for obs in observations]
+    rssi = np.fromiter((obs.rssi for obs in observations), dtype=np.float64)
+    filtered_rssi, innovations = filter_bank.update_batch(node_id, device_ids, rssi)
+
     filtered: list[Observation] = []
-    for obs in observations:
-        filtered_rssi, innovation = filter_bank.update(node_id, obs.device_id, obs.rssi)
+    for obs, value, innovation in zip(observations, filtered_rssi, innovations):
         metadata = dict(obs.metadata)
         metadata["raw_rssi"] = obs.rssi
-        metadata["innovation"] = innovation
+        metadata["innovation"] = float(innovation)
         filtered.append(Observation(
             device_id=obs.device_id,
-            rssi=filtered_rssi,
+            rssi=float(value),
             timestamp=obs.timestamp,
             signal_type=obs.signal_type,
             metadata=metadata,
@@ -82,6 +109,9 @@ def _apply_kalman(
 
 
 async def _run_calibrate_command(config: SenseyeConfig, floorplan_path: Path) -> None:
+    from senseye.calibration import calibrate_floorplan
+    from senseye.mapping.static.floorplan import save as save_floorplan
+
     log.info("starting calibration")
     floorplan, _ = await calibrate_floorplan(
         config,
@@ -99,8 +129,10 @@ async def _run_calibrate_command(config: SenseyeConfig, floorplan_path: Path) ->
 
 
 async def _sample_acoustic_observation(config: SenseyeConfig) -> Observation | None:
+    from senseye.node.acoustic import cached_chirp, echo_profile
+
     try:
-        chirp = generate_chirp(
+        chirp = cached_chirp(
             freq_start=config.chirp_freq_start,
             freq_end=config.chirp_freq_end,
             duration=config.chirp_duration,
@@ -136,6 +168,13 @@ async def _handle_acoustic_ping_request(
         return False
 
     # Always emit on this node's deterministic channel for passive ID.
+    from senseye.node.acoustic import (
+        DEFAULT_SAMPLE_RATE,
+        cached_chirp,
+        get_chirp_params,
+        play_chirp,
+    )
+
     f_start, f_end = get_chirp_params(config.node_id)
 
     requested_duration = msg.get("chirp_duration", config.chirp_duration)
@@ -158,7 +197,7 @@ async def _handle_acoustic_ping_request(
         else _ACOUSTIC_PING_DELAY_S
     )
 
-    chirp = generate_chirp(
+    chirp = cached_chirp(
         freq_start=f_start,
         freq_end=f_end,
         duration=duration,
@@ -167,75 +206,88 @@ async def _handle_acoustic_ping_request(
     return await play_chirp(chirp=chirp, sample_rate=sample_rate, delay=delay)
 
 
-async def _measure_peer_acoustic_tof(
+async def _collect_peer_acoustic_observations(
     mesh: PeerMesh,
     config: SenseyeConfig,
-    peer_id: str,
-) -> float | None:
-    if peer_id == config.node_id:
-        return None
-
-    # We expect the peer to chirp on THEIR channel
-    f_start, f_end = get_chirp_params(peer_id)
-    expected_chirp = generate_chirp(
-        freq_start=f_start,
-        freq_end=f_end,
-        duration=config.chirp_duration,
-        sample_rate=DEFAULT_SAMPLE_RATE,
+    peer_ids: set[str],
+) -> list[Observation]:
+    """Measure acoustic ToF to every peer in one recording pass.
+
+    The microphone is a single shared resource (sounddevice's convenience
+    functions share one global stream), so instead of one record+ping round
+    trip per peer we record once, ping all peers concurrently while the mic
+    is open, and matched-filter the same capture against each peer's
+    frequency channel. Wall-clock cost is one recording regardless of peer
+    count.
+    """
+    from senseye.node.acoustic import (
+        DEFAULT_SAMPLE_RATE,
+        SPEED_OF_SOUND,
+        cached_chirp,
+        detect_chirp,
+        get_chirp_params,
+        record_audio,
     )
 
+    peers = sorted(pid for pid in peer_ids if pid != config.node_id)
+    if not peers:
+        return []
+
     record_duration = max(config.chirp_duration + _ACOUSTIC_PING_DELAY_S + 0.5, 0.8)
-    listen_task = asyncio.create_task(
-        listen_for_chirp(
-            chirp=expected_chirp,
-            sample_rate=DEFAULT_SAMPLE_RATE,
-            record_duration=record_duration,
-            template_length=0,
-        )
+    record_task = asyncio.create_task(
+        record_audio(sample_rate=DEFAULT_SAMPLE_RATE, record_duration=record_duration)
     )
     await asyncio.sleep(0.02)
     loop = asyncio.get_running_loop()
-    request_sent_at = loop.time()
-    try:
-        response = await mesh.request_acoustic_ping(
-            peer_id,
-            delay_s=_ACOUSTIC_PING_DELAY_S,
-            sample_rate=DEFAULT_SAMPLE_RATE,
-            freq_start=f_start,
-            freq_end=f_end,
-            chirp_duration=config.chirp_duration,
-            timeout=record_duration + 1.0,
-        )
-    except ConnectionError:
-        response = None
-    response_received_at = loop.time()
-    listen_result = await listen_task
 
-    if response is None or not bool(response.get("ok")):
-        return None
-    if listen_result is None or listen_result.tof is None:
-        return None
-    if listen_result.peak_snr < _ACOUSTIC_MIN_SNR:
-        return None
-
-    one_way_network = max((response_received_at - request_sent_at) / 2.0, 0.0)
-    expected_emit_at = request_sent_at + one_way_network + _ACOUSTIC_PING_DELAY_S
-    arrival_at = listen_result.record_started_at + listen_result.tof
-    estimated_tof = arrival_at - expected_emit_at
-    if estimated_tof <= 0 or estimated_tof > _MAX_ACOUSTIC_TOF_S:
-        return None
-    return estimated_tof
+    async def request_ping(peer_id: str) -> tuple[float, float, dict | None]:
+        f_start, f_end = get_chirp_params(peer_id)
+        request_sent_at = loop.time()
+        try:
+            response = await mesh.request_acoustic_ping(
+                peer_id,
+                delay_s=_ACOUSTIC_PING_DELAY_S,
+                sample_rate=DEFAULT_SAMPLE_RATE,
+                freq_start=f_start,
+                freq_end=f_end,
+                chirp_duration=config.chirp_duration,
+                timeout=record_duration + 1.0,
+            )
+        except ConnectionError:
+            response = None
+        return request_sent_at, loop.time(), response
 
+    ping_results = await asyncio.gather(*(request_ping(pid) for pid in peers))
+    recording = await record_task
+    if recording is None:
+        return []
+    recorded, record_started_at = recording
 
-async def _collect_peer_acoustic_observations(
-    mesh: PeerMesh,
-    config: SenseyeConfig,
-    peer_ids: set[str],
-) -> list[Observation]:
     observations: list[Observation] = []
-    for peer_id in sorted(peer_ids):
-        tof = await _measure_peer_acoustic_tof(mesh=mesh, config=config, peer_id=peer_id)
-        if tof is None:
+    for peer_id, (request_sent_at, response_received_at, response) in zip(
+        peers, ping_results
+    ):
+        if response is None or not bool(response.get("ok")):
+            continue
+        # The peer chirped on THEIR channel; filter for that template.
+        f_start, f_end = get_chirp_params(peer_id)
+        expected_chirp = cached_chirp(
+            freq_start=f_start,
+            freq_end=f_end,
+            duration=config.chirp_duration,
+            sample_rate=DEFAULT_SAMPLE_RATE,
+        )
+        tof_in_recording, peak_snr = detect_chirp(
+            recorded, expected_chirp, DEFAULT_SAMPLE_RATE, template_length=0
+        )
+        if tof_in_recording is None or peak_snr < _ACOUSTIC_MIN_SNR:
+            continue
+
+        one_way_network = max((response_received_at - request_sent_at) / 2.0, 0.0)
+        expected_emit_at = request_sent_at + one_way_network + _ACOUSTIC_PING_DELAY_S
+        arrival_at = record_started_at + tof_in_recording
+        tof = arrival_at - expected_emit_at
+        if tof <= 0 or tof > _MAX_ACOUSTIC_TOF_S:
             continue
         distance = tof * SPEED_OF_SOUND
         observations.append(Observation(
@@ -252,24 +304,55 @@ async def _collect_peer_acoustic_observations(
     return observations
 
 
+# Zone names interned to small ints so the motion-event mask below is
+# integer vector compares instead of per-device string branches. Zone
+# vocabularies are tiny and stable, so the table never grows past a handful.
+_ZONE_IDS: dict[str, int] = {}
+_ZONE_NAMES: list[str] = []
+
+
+def _zone_id(zone: str | None) -> int:
+    if zone is None:
+        return -1
+    zid = _ZONE_IDS.get(zone)
+    if zid is None:
+        zid = _ZONE_IDS[zone] = len(_ZONE_NAMES)
+        _ZONE_NAMES.append(zone)
+    return zid
+
+
 def _extract_motion_events(
     world: WorldState,
     last_zone_by_device: dict[str, str],
     timestamp: float,
 ) -> list[tuple[str, str, float]]:
-    events: list[tuple[str, str, float]] = []
-    for device_id, device in world.devices.items():
-        current_zone = device.zone
-        if current_zone is None:
-            continue
-        previous_zone = last_zone_by_device.get(device_id)
-        if (
-            previous_zone is not None
-            and previous_zone != current_zone
-            and device.moving
-        ):
-            events.append((previous_zone, current_zone, timestamp))
-        last_zone_by_device[device_id] = current_zone
+    devices = world.devices
+    if not devices:
+        return []
+    import numpy as np
+
+    n = len(devices)
+    device_ids = list(devices)
+    cur = np.fromiter(
+        (_zone_id(d.zone) for d in devices.values()), dtype=np.int32, count=n
+    )
+    prev = np.fromiter(
+        (_zone_id(last_zone_by_device.get(did)) for did in device_ids),
+        dtype=np.int32,
+        count=n,
+    )
+    moving = np.fromiter((d.moving for d in devices.values()), dtype=bool, count=n)
+
+    # Branchless event selection: one mask instead of three ifs per device.
+    event_mask = (cur >= 0) & (prev >= 0) & (prev != cur) & moving
+    events = [
+        (_ZONE_NAMES[prev[i]], _ZONE_NAMES[cur[i]], timestamp)
+        for i in np.flatnonzero(event_mask)
+    ]
+
+    # Only devices whose zone actually changed need a dict write.
+    for i in np.flatnonzero((cur >= 0) & (cur != prev)):
+        last_zone_by_device[device_ids[i]] = _ZONE_NAMES[cur[i]]
     return events
 
 
@@ -310,9 +393,9 @@ def build_config() -> SenseyeConfig:
     config.mesh_port = args.port
     config.wifi_enabled = not args.no_wifi
     config.ble_enabled = not args.no_ble
-    config.acoustic_mode = _parse_acoustic_mode(args.acoustic)
-    if config.acoustic_mode == AcousticMode.INTERVAL:
-        config.acoustic_interval = parse_acoustic_interval(args.acoustic)
+    config.acoustic_mode, acoustic_interval = parse_acoustic(args.acoustic)
+    if acoustic_interval is not None:
+        config.acoustic_interval = acoustic_interval
 
     if args.headless:
         config.ui_enabled = False
@@ -333,6 +416,24 @@ async def run(config: SenseyeConfig) -> None:
         await _run_calibrate_command(config, floorplan_path)
         return
 
+    # Heavy sensing/fusion imports, deferred until we know we are actually
+    # running the node (not --help, not a config error, not calibrate-only).
+    import numpy as np
+
+    from senseye.calibration import calibrate_floorplan
+    from senseye.fusion.consensus import fuse_beliefs
+    from senseye.fusion.runtime import (
+        estimate_device_positions,
+        reconstruct_attenuation_grid,
+    )
+    from senseye.mapping.dynamic.state import WorldState, update_world
+    from senseye.mapping.static.floorplan import load as load_floorplan
+    from senseye.mapping.static.floorplan import save as save_floorplan
+    from senseye.mapping.static.topology import update_topology
+    from senseye.node.filter import FilterBank
+    from senseye.node.inference import expected_rssi_map, infer
+    from senseye.node.peer import PeerMesh
+
     # Load existing floorplan
     floorplan: FloorPlan | None = None
     if floorplan_path.exists():
@@ -351,7 +452,6 @@ async def run(config: SenseyeConfig) -> None:
     # Track latest sequence number seen for each peer to prevent loops/re-processing
     peer_seq_numbers: dict[str, int] = {}
 
-    lock = asyncio.Lock()
     baseline_rssi: dict[str, float] = {}
     known_peers: set[str] = set()
 
@@ -360,10 +460,25 @@ async def run(config: SenseyeConfig) -> None:
     # Peer mesh
     mesh = PeerMesh(node_id=config.node_id, port=config.mesh_port)
 
+    # Incoming beliefs funnel through one bounded queue drained by a single
+    # long-lived consumer: no Task allocation per message, FIFO application
+    # order, and gossip bursts hit backpressure (drop at the edge) instead
+    # of piling up scheduled tasks.
+    belief_queue: asyncio.Queue[Belief] = asyncio.Queue(maxsize=1024)
+
     def on_peer_belief(belief: Belief) -> None:
-        asyncio.create_task(process_peer_belief(belief))
+        try:
+            belief_queue.put_nowait(belief)
+        except asyncio.QueueFull:
+            log.debug("belief queue full, dropping update from %s", belief.node_id)
+
+    async def belief_consumer() -> None:
+        while True:
+            belief = await belief_queue.get()
+            await process_peer_belief(belief)
 
     async def process_peer_belief(belief: Belief):
+        nonlocal peer_beliefs
         # 1. Dedup: Check if we've already seen this sequence number from this node
         last_seq = peer_seq_numbers.get(belief.node_id, -1)
         if belief.sequence_number <= last_seq:
@@ -372,30 +487,17 @@ async def run(config: SenseyeConfig) -> None:
         # Update tracker
         peer_seq_numbers[belief.node_id] = belief.sequence_number
 
-        # 2. Store: Update our knowledge of this peer
-        async with lock:
-            peer_beliefs[belief.node_id] = belief
-
-        # 3. Relay (Gossip): If TTL allows, re-broadcast to neighbors
-        # We only relay if hop_count > 0. We decrement before sending.
-        # Note: We do NOT modify the original belief object in storage,
-        # but we create a copy or modify on the fly for sending.
-        # Actually, since Belief is a dataclass, it's mutable. Let's be careful.
+        # 2. Store: copy-on-write. Each arrival rebinds a fresh dict, so the
+        # sense loop's per-cycle "snapshot" is a pointer read instead of a
+        # copy; old snapshots stay valid across awaits for free. Writes are
+        # rarer than cycles now that peers coalesce their broadcasts.
+        peer_beliefs = {**peer_beliefs, belief.node_id: belief}
 
+        # 3. Relay (Gossip): if TTL allows, re-broadcast with decremented
+        # hop count. The stored belief stays untouched (it's still *their*
+        # belief); receivers' sequence-number check stops loops.
         if belief.hop_count > 0:
-            # Create a relay copy with decremented TTL
-            # We don't change the node_id (it's still *their* belief)
-            # We rely on the mesh to not send it back to the sender if possible,
-            # but the sequence number check protects us anyway.
-            relay_belief = Belief(
-                node_id=belief.node_id,
-                timestamp=belief.timestamp,
-                sequence_number=belief.sequence_number,
-                hop_count=belief.hop_count - 1,
-                links=belief.links,
-                devices=belief.devices,
-                zones=belief.zones,
-            )
+            relay_belief = dataclasses.replace(belief, hop_count=belief.hop_count - 1)
             # Fire and forget relay
             asyncio.create_task(mesh.broadcast_belief(relay_belief))
 
@@ -407,13 +509,11 @@ async def run(config: SenseyeConfig) -> None:
 
     shutdown = asyncio.Event()
 
-    def handle_signal() -> None:
-        log.info("shutting down...")
-        shutdown.set()
-
+    # Wire signals straight to Event.set (one less Python frame per signal);
+    # the shutdown log line moves to the teardown path below.
     loop = asyncio.get_running_loop()
     for sig in (signal.SIGINT, signal.SIGTERM):
-        loop.add_signal_handler(sig, handle_signal)
+        loop.add_signal_handler(sig, shutdown.set)
 
     await mesh.start()
     log.info(
@@ -432,12 +532,42 @@ async def run(config: SenseyeConfig) -> None:
         nonlocal world
         nonlocal local_sequence_number
 
-        last_time = time.time()
+        # loop.time() is monotonic and syscall-cheap; wall-clock time.time()
+        # stays for timestamps and calibration schedules shared with peers.
+        loop = asyncio.get_running_loop()
+        last_time = loop.time()
         last_belief_sent = 0.0
+        last_sent_digest: tuple | None = None
         last_calibration_at = 0.0
-        motion_events: list[tuple[str, str, float]] = []
+        # deque(maxlen=...) evicts oldest events in O(1) per append; no
+        # explicit trim pass needed when the buffer overflows.
+        motion_events: deque[tuple[str, str, float]] = deque(maxlen=_MAX_MOTION_EVENTS)
         last_zone_by_device: dict[str, str] = {}
         belief_period = 1.0 / max(config.belief_rate, _MIN_BELIEF_RATE)
+        # Config is immutable for the process lifetime; bind the per-cycle
+        # attribute reads to locals once. floorplan-derived state stays
+        # per-cycle because recalibration swaps the floorplan object.
+        wifi_enabled = config.wifi_enabled
+        ble_enabled = config.ble_enabled
+        ble_duration = config.ble_duration
+        my_node_id = config.node_id
+        scan_interval = config.scan_interval
+        acoustic_interval = config.acoustic_interval
+        radios_enabled = wifi_enabled or ble_enabled
+        fixed_scanner = config.node_role == NodeRole.FIXED and radios_enabled
+        # Expected free-space RSSI per positioned peer, rebuilt only when
+        # recalibration swaps the floorplan object.
+        expected_rssi: dict[str, float] = {}
+        expected_rssi_floorplan: object = object()
+        # Memoized fusion: reuse the fused belief while the local digest and
+        # the peer snapshot (copy-on-write, so identity == content) repeat.
+        last_fused: Belief | None = None
+        last_fusion_snapshot: dict[str, Belief] | None = None
+        last_fusion_key: tuple | None = None
+        # Back off scanning while the fused picture is static; any material
+        # change snaps back to the configured interval.
+        effective_interval = scan_interval
+        last_fingerprint: tuple | None = None
         next_interval_calibration: float | None = None
         if config.acoustic_mode == AcousticMode.INTERVAL:
             next_interval_calibration = time.time() + config.acoustic_interval
@@ -445,18 +575,44 @@ async def run(config: SenseyeConfig) -> None:
         if config.acoustic_mode == AcousticMode.INTERVAL:
             next_acoustic_sample = time.time() + config.acoustic_interval
 
-        while not shutdown.is_set():
+        # Drift check inputs as an aligned vector; rebuilt only when
+        # recalibration rebinds baseline_rssi (identity check, as with
+        # expected_rssi above).
+        drift_baseline_src: dict[str, float] | None = None
+        drift_ids: list[str] = []
+        drift_baseline_vec = np.zeros(0, dtype=np.float64)
+
+        shutdown_waiter = asyncio.ensure_future(shutdown.wait())
+        shutting_down = shutdown.is_set
+        last_mesh_bytes = mesh.bytes_sent
+        while not shutting_down():
+            cycle_start = loop.time()
             now = time.time()
-            dt = now - last_time
-            last_time = now
+            dt = cycle_start - last_time
+            last_time = cycle_start
             peer_observations: list[Observation] = []
 
+            # Radio coexistence: on shared Wi-Fi/BLE radios an aggressive BLE
+            # scan starves the mesh backbone (and gets starved back). Shorten
+            # the BLE window on cycles that pushed real mesh traffic.
+            mesh_bytes = mesh.bytes_sent
+            mesh_delta = mesh_bytes - last_mesh_bytes
+            last_mesh_bytes = mesh_bytes
+            cycle_ble_duration = ble_duration
+            if mesh_delta > _BLE_COEX_BYTES:
+                cycle_ble_duration = ble_duration * _BLE_COEX_SCALE
+                log.debug(
+                    "mesh sent %d bytes since last cycle, shortening BLE scan to %.2fs",
+                    mesh_delta,
+                    cycle_ble_duration,
+                )
+
             # Scan
-            if config.wifi_enabled or config.ble_enabled:
+            if radios_enabled:
                 observations = await scan_all(
-                    wifi=config.wifi_enabled,
-                    ble=config.ble_enabled,
-                    ble_duration=config.ble_duration,
+                    wifi=wifi_enabled,
+                    ble=ble_enabled,
+                    ble_duration=cycle_ble_duration,
                 )
             else:
                 observations = []
@@ -475,10 +631,10 @@ async def run(config: SenseyeConfig) -> None:
                     peer_ids=set(mesh.get_peers()),
                 )
                 observations.extend(peer_observations)
-                next_acoustic_sample = now + config.acoustic_interval
+                next_acoustic_sample = now + acoustic_interval
 
             # Filter (Kalman) each observation
-            filtered_observations = _apply_kalman(observations, filter_bank, config.node_id)
+            filtered_observations = _apply_kalman(observations, filter_bank, my_node_id)
 
             if observations:
                 log.debug("scanned %d signals", len(observations))
@@ -487,11 +643,15 @@ async def run(config: SenseyeConfig) -> None:
             node_positions = {}
             if floorplan is not None:
                 node_positions = floorplan.node_positions
+            if floorplan is not expected_rssi_floorplan:
+                expected_rssi = expected_rssi_map(node_positions, my_node_id)
+                expected_rssi_floorplan = floorplan
             local_belief = infer(
                 observations=filtered_observations,
                 rssi_history=rssi_history,
                 node_positions=node_positions,
-                my_node_id=config.node_id,
+                my_node_id=my_node_id,
+                expected_rssi=expected_rssi,
             )
 
             # Attach sequence number and reset hop count for OUR belief
@@ -505,17 +665,46 @@ async def run(config: SenseyeConfig) -> None:
             }
             local_sequence_number += 1
 
-            # Share with peers
-            if (now - last_belief_sent) >= belief_period:
+            # Share with peers: rate-limited as before, but quiet cycles
+            # whose belief digest matches the last send are skipped entirely
+            # (one heartbeat per _MAX_BELIEF_GAP keeps peers' liveness view
+            # fresh). Peers dedupe on sequence number, so skipping is safe.
+            belief_digest = (
+                _belief_fingerprint(local_belief.devices, local_belief.links),
+                tuple(sorted(local_belief.acoustic_ranges.items())),
+            )
+            if (now - last_belief_sent) >= belief_period and (
+                belief_digest != last_sent_digest
+                or (now - last_belief_sent) >= _MAX_BELIEF_GAP
+            ):
                 await mesh.broadcast_belief(local_belief)
                 last_belief_sent = now
-
-            # Fuse with peer beliefs
-            async with lock:
-                # Copy the dict to avoid mutation during fusion
-                snapshot = dict(peer_beliefs)
-
-            fused = fuse_beliefs(local_belief, snapshot)
+                last_sent_digest = belief_digest
+
+            # Fuse with peer beliefs. peer_beliefs is copy-on-write (see
+            # process_peer_belief), so grabbing the reference is the snapshot.
+            snapshot = peer_beliefs
+
+            # Fusion is deterministic in its inputs; on quiet cycles the
+            # digest and snapshot repeat and the previous result stands.
+            fusion_key = (
+                belief_digest,
+                tuple(sorted(
+                    (zone_id, round(zone.occupied, 2), round(zone.motion, 2))
+                    for zone_id, zone in local_belief.zones.items()
+                )),
+            )
+            if (
+                last_fused is not None
+                and last_fusion_snapshot is snapshot
+                and last_fusion_key == fusion_key
+            ):
+                fused = last_fused
+            else:
+                fused = fuse_beliefs(local_belief, snapshot)
+                last_fused = fused
+                last_fusion_snapshot = snapshot
+                last_fusion_key = fusion_key
             # Use current snapshot for downstream logic
             # (Note: using .values() here for list compatibility in visualization/logging if needed,
             # but fusion logic now takes the dict)
@@ -524,20 +713,27 @@ async def run(config: SenseyeConfig) -> None:
             # Update world state
             device_positions: dict[str, tuple[float, float]] = {}
             if floorplan is not None:
-                estimates = estimate_device_positions(
+                # Trilateration and the tomography ridge solve are the numpy-
+                # heavy part of a cycle; run them in the default thread
+                # executor so mesh I/O and the UI stay responsive while BLAS
+                # (which releases the GIL) grinds. Inputs are not mutated
+                # after publication, so sharing them with the worker is safe.
+                estimates = await loop.run_in_executor(None, partial(
+                    estimate_device_positions,
                     beliefs=fusion_window,
                     node_positions=floorplan.node_positions,
-                )
+                ))
                 device_positions = {
                     device_id: position
                     for device_id, (position, _uncertainty) in estimates.items()
                 }
-                attenuation_grid = reconstruct_attenuation_grid(
+                attenuation_grid = await loop.run_in_executor(None, partial(
+                    reconstruct_attenuation_grid,
                     beliefs=fusion_window,
                     node_positions=floorplan.node_positions,
                     bounds=floorplan.bounds,
                     resolution=_TOMOGRAPHY_RESOLUTION,
-                )
+                ))
                 if attenuation_grid.size > 0:
                     floorplan.attenuation_grid = attenuation_grid.tolist()
                     floorplan.attenuation_resolution = _TOMOGRAPHY_RESOLUTION
@@ -559,8 +755,6 @@ async def run(config: SenseyeConfig) -> None:
                 new_events = _extract_motion_events(world, last_zone_by_device, now)
                 if new_events:
                     motion_events.extend(new_events)
-                    if len(motion_events) > _MAX_MOTION_EVENTS:
-                        del motion_events[:-_MAX_MOTION_EVENTS]
                     updated_graph = update_topology(floorplan.rooms, motion_events)
                     if updated_graph != floorplan.rooms:
                         floorplan.rooms = updated_graph
@@ -574,14 +768,21 @@ async def run(config: SenseyeConfig) -> None:
             # Rebuild static map when topology or acoustic schedule changes.
             peer_ids = set(mesh.get_peers())
             latest_rssi = {obs.device_id: obs.rssi for obs in filtered_observations}
-            common = [device_id for device_id in baseline_rssi if device_id in latest_rssi]
-            avg_drift = 0.0
-            if common:
-                avg_drift = sum(
-                    abs(latest_rssi[device_id] - baseline_rssi[device_id])
-                    for device_id in common
-                ) / len(common)
-            drift_due = len(common) >= 3 and avg_drift >= _RSSI_DRIFT_THRESHOLD
+            if baseline_rssi is not drift_baseline_src:
+                drift_baseline_src = baseline_rssi
+                drift_ids = list(baseline_rssi)
+                drift_baseline_vec = np.fromiter(
+                    baseline_rssi.values(), dtype=np.float64, count=len(drift_ids)
+                )
+            latest_vec = np.fromiter(
+                (latest_rssi.get(device_id, np.nan) for device_id in drift_ids),
+                dtype=np.float64,
+                count=len(drift_ids),
+            )
+            seen = np.isfinite(latest_vec)
+            drift = np.abs(latest_vec[seen] - drift_baseline_vec[seen])
+            avg_drift = float(drift.mean()) if drift.size else 0.0
+            drift_due = drift.size >= 3 and avg_drift >= _RSSI_DRIFT_THRESHOLD
 
             interval_due = (
                 next_interval_calibration is not None
@@ -589,7 +790,7 @@ async def run(config: SenseyeConfig) -> None:
             )
 
             reasons: list[str] = []
-            if config.node_role == NodeRole.FIXED and (config.wifi_enabled or config.ble_enabled):
+            if fixed_scanner:
                 if floorplan is None:
                     reasons.append("no-floorplan")
                 elif peer_ids != known_peers:
@@ -626,20 +827,27 @@ async def run(config: SenseyeConfig) -> None:
                     log.exception("map recalibration failed")
                 last_calibration_at = time.time()
                 if next_interval_calibration is not None:
-                    next_interval_calibration = last_calibration_at + config.acoustic_interval
+                    next_interval_calibration = last_calibration_at + acoustic_interval
             elif interval_due and next_interval_calibration is not None:
-                next_interval_calibration = now + config.acoustic_interval
+                next_interval_calibration = now + acoustic_interval
             elif peer_ids != known_peers:
                 known_peers = peer_ids
 
-            # Wait for next cycle
-            elapsed = time.time() - now
-            sleep_time = max(0, config.scan_interval - elapsed)
-            try:
-                await asyncio.wait_for(shutdown.wait(), timeout=sleep_time)
-                break  # shutdown was set
-            except asyncio.TimeoutError:
-                pass
+            fingerprint = _belief_fingerprint(fused.devices, fused.links)
+            if fingerprint == last_fingerprint:
+                effective_interval = min(effective_interval * 2.0, _MAX_SCAN_INTERVAL)
+            else:
+                effective_interval = scan_interval
+            last_fingerprint = fingerprint
+
+            # Wait for next cycle. A single long-lived waiter avoids the
+            # task/future churn wait_for would pay every iteration.
+            sleep_time = effective_interval - (loop.time() - cycle_start)
+            if sleep_time > 0:
+                done, _ = await asyncio.wait({shutdown_waiter}, timeout=sleep_time)
+                if shutdown_waiter in done:
+                    break  # shutdown was set
+        shutdown_waiter.cancel()
 
     # Dashboard
     async def ui_loop() -> None:
@@ -652,17 +860,27 @@ async def run(config: SenseyeConfig) -> None:
         dashboard = Dashboard(config)
 
         async def state_stream():
-            while not shutdown.is_set():
-                yield world
-                try:
-                    await asyncio.wait_for(shutdown.wait(), timeout=config.ui_refresh)
-                    return
-                except asyncio.TimeoutError:
-                    pass
+            # Same persistent-waiter pattern as sense_loop: one task reused
+            # across refreshes instead of a wait_for Task per frame. The
+            # generation counter skips frames where nothing changed.
+            waiter = asyncio.ensure_future(shutdown.wait())
+            shutting_down = shutdown.is_set
+            last_gen = -1
+            try:
+                while not shutting_down():
+                    if world.gen != last_gen:
+                        last_gen = world.gen
+                        yield world
+                    done, _ = await asyncio.wait({waiter}, timeout=config.ui_refresh)
+                    if waiter in done:
+                        return
+            finally:
+                waiter.cancel()
 
         await dashboard.run(state_stream())
 
     # Run loops
+    consumer_task = asyncio.create_task(belief_consumer())
     tasks = [asyncio.create_task(sense_loop())]
     if config.ui_enabled:
         tasks.append(asyncio.create_task(ui_loop()))
@@ -674,11 +892,21 @@ async def run(config: SenseyeConfig) -> None:
     except asyncio.CancelledError:
         pass
     finally:
+        log.info("shutting down...")
+        consumer_task.cancel()
         await mesh.stop()
         log.info("senseye stopped")
 
 
 def main() -> None:
+    # uvloop's libuv-backed loop cuts per-callback dispatch overhead for the
+    # scan/broadcast/mesh workload; purely optional, like sounddevice.
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     config = build_config()
     asyncio.run(run(config))
 
@@ -5,6 +5,8 @@ from __future__ import annotations
 import time
 from dataclasses import dataclass
 
+import numpy as np
+
 
 @dataclass
 class TrackedDevice:
@@ -18,8 +20,35 @@ class TrackedDevice:
 
 
 class DeviceTracker:
+    """Tracks devices in struct-of-arrays form, keyed by a device_id->row map.
+
+    `last_seen` — the only field the age scans compare — lives in one
+    contiguous float64 array, so get_active/cleanup are a single vectorized
+    comparison instead of an attribute walk over per-device objects. The
+    rarely-scanned fields stay in parallel lists aligned with the rows.
+    Returned TrackedDevice instances are snapshots of a row, not live views.
+    """
+
     def __init__(self) -> None:
-        self._devices: dict[str, TrackedDevice] = {}
+        self._id_to_row: dict[str, int] = {}
+        self._ids: list[str] = []
+        self._names: list[str | None] = []
+        self._positions: list[tuple[float, float] | None] = []
+        self._zones: list[str | None] = []
+        self._moving: list[bool] = []
+        self._signal_types: list[str] = []
+        self._last_seen = np.zeros(0, dtype=np.float64)
+
+    def _materialize(self, row: int) -> TrackedDevice:
+        return TrackedDevice(
+            device_id=self._ids[row],
+            name=self._names[row],
+            position=self._positions[row],
+            zone=self._zones[row],
+            moving=self._moving[row],
+            last_seen=float(self._last_seen[row]),
+            signal_type=self._signal_types[row],
+        )
 
     def update(
         self,
@@ -33,43 +62,56 @@ class DeviceTracker:
     ) -> TrackedDevice:
         """Upsert a device with latest observation."""
         now = time.time()
-        existing = self._devices.get(device_id)
-        if existing is None:
-            device = TrackedDevice(
-                device_id=device_id,
-                name=name,
-                position=position,
-                zone=zone,
-                moving=moving,
-                last_seen=now,
-                signal_type=signal_type,
-            )
-            self._devices[device_id] = device
-            return device
+        row = self._id_to_row.get(device_id)
+        if row is None:
+            row = len(self._ids)
+            self._id_to_row[device_id] = row
+            self._ids.append(device_id)
+            self._names.append(name)
+            self._positions.append(position)
+            self._zones.append(zone)
+            self._moving.append(moving)
+            self._signal_types.append(signal_type)
+            if row >= self._last_seen.shape[0]:
+                grow = max(16, self._last_seen.shape[0])
+                self._last_seen = np.concatenate(
+                    [self._last_seen, np.zeros(grow, dtype=np.float64)]
+                )
+            self._last_seen[row] = now
+            return self._materialize(row)
 
         # Update fields, keeping previous values where new data is None
         if name is not None:
-            existing.name = name
+            self._names[row] = name
         if position is not None:
-            existing.position = position
+            self._positions[row] = position
         if zone is not None:
-            existing.zone = zone
-        existing.moving = moving
-        existing.last_seen = now
-        existing.signal_type = signal_type
-        return existing
+            self._zones[row] = zone
+        self._moving[row] = moving
+        self._signal_types[row] = signal_type
+        self._last_seen[row] = now
+        return self._materialize(row)
 
     def get_active(self, max_age: float = 60.0) -> dict[str, TrackedDevice]:
         """Return devices seen within max_age seconds."""
         cutoff = time.time() - max_age
-        return {
-            did: dev for did, dev in self._devices.items()
-            if dev.last_seen >= cutoff
-        }
+        n = len(self._ids)
+        rows = np.nonzero(self._last_seen[:n] >= cutoff)[0]
+        return {self._ids[r]: self._materialize(r) for r in rows}
 
     def cleanup(self, max_age: float = 60.0) -> None:
         """Remove devices not seen within max_age seconds."""
         cutoff = time.time() - max_age
-        stale = [did for did, dev in self._devices.items() if dev.last_seen < cutoff]
-        for did in stale:
-            del self._devices[did]
+        n = len(self._ids)
+        keep_mask = self._last_seen[:n] >= cutoff
+        if keep_mask.all():
+            return
+        keep = keep_mask.tolist()
+        self._ids = [v for v, k in zip(self._ids, keep) if k]
+        self._names = [v for v, k in zip(self._names, keep) if k]
+        self._positions = [v for v, k in zip(self._positions, keep) if k]
+        self._zones = [v for v, k in zip(self._zones, keep) if k]
+        self._moving = [v for v, k in zip(self._moving, keep) if k]
+        self._signal_types = [v for v, k in zip(self._signal_types, keep) if k]
+        self._last_seen = self._last_seen[:n][keep_mask].copy()
+        self._id_to_row = {did: row for row, did in enumerate(self._ids)}
@@ -28,17 +28,20 @@ def update_motion(
     """
     now = time.time()
 
-    # Apply decay to all existing zones
-    for zone in list(state.zone_motion):
-        state.zone_motion[zone] *= math.exp(-decay * dt)
+    # Decay all existing zones in one pass. The exponential is loop-invariant
+    # so it runs once, and writing values during items() iteration is safe
+    # because no keys are added here (the merge below may add keys).
+    factor = math.exp(-decay * dt)
+    zone_motion = state.zone_motion
+    for zone, intensity in zone_motion.items():
+        decayed = intensity * factor
         # Clamp near-zero to zero
-        if state.zone_motion[zone] < 0.01:
-            state.zone_motion[zone] = 0.0
+        zone_motion[zone] = 0.0 if decayed < 0.01 else decayed
 
     # Merge in new observations
     for zone, belief in zone_beliefs.items():
-        current = state.zone_motion.get(zone, 0.0)
-        state.zone_motion[zone] = max(current, belief.motion)
+        current = zone_motion.get(zone, 0.0)
+        zone_motion[zone] = max(current, belief.motion)
         state.last_updated[zone] = now
 
     return state
@@ -28,6 +28,9 @@ class WorldState:
     nodes: dict[str, NodeInfo] = field(default_factory=dict)
     map_age: float = 0.0  # seconds since calibration
     timestamp: float = field(default_factory=time.time)
+    # Bumped whenever an update changes something observable; lets consumers
+    # (e.g. the dashboard) skip redundant snapshots/renders.
+    gen: int = 0
 
 
 def _nearest_room(
@@ -65,6 +68,7 @@ def update_world(
     upserts the reporting node, and recomputes map age.
     """
     now = time.time()
+    changed = bool(belief.devices) or bool(belief.zones)
 
     # Update motion from zone beliefs
     state.motion = update_motion(state.motion, belief.zones, dt)
@@ -93,6 +97,7 @@ def update_world(
     for node_id in active_nodes:
         node = state.nodes.get(node_id)
         if node is None:
+            changed = True
             state.nodes[node_id] = NodeInfo(
                 node_id=node_id,
                 name=node_id,
@@ -101,13 +106,16 @@ def update_world(
                 last_seen=now,
             )
             continue
+        if not node.online:
+            changed = True
         node.online = True
         node.last_seen = now
 
     # Mark stale nodes as offline.
     for node in state.nodes.values():
-        if now - node.last_seen > 15.0:
+        if now - node.last_seen > 15.0 and node.online:
             node.online = False
+            changed = True
 
     # Update map age
     if state.floorplan is not None:
@@ -116,4 +124,6 @@ def update_world(
         state.map_age = 0.0
 
     state.timestamp = now
+    if changed:
+        state.gen += 1
     return state
@@ -120,7 +120,14 @@ def save(plan: FloorPlan, path: Path = DEFAULT_PATH) -> None:
 
 def load(path: Path = DEFAULT_PATH) -> FloorPlan:
     """Deserialize FloorPlan from JSON."""
-    data = json.loads(path.read_text())
+    # orjson parses the attenuation grid (the bulk of a calibrated plan)
+    # several times faster than stdlib json; optional, like sounddevice.
+    try:
+        import orjson
+    except ImportError:
+        data = json.loads(path.read_text())
+    else:
+        data = orjson.loads(path.read_bytes())
     return _plan_from_dict(data)
 
 
@@ -32,12 +32,7 @@ def mds_positions(distances: np.ndarray) -> np.ndarray:
     # Symmetrize to handle floating-point asymmetry
     B = (B + B.T) / 2.0
 
-    eigenvalues, eigenvectors = np.linalg.eigh(B)
-
-    # eigh returns ascending order; take the two largest
-    idx = np.argsort(eigenvalues)[::-1]
-    top2_vals = eigenvalues[idx[:2]]
-    top2_vecs = eigenvectors[:, idx[:2]]
+    top2_vals, top2_vecs = _top2_eigenpairs(B)
 
     # Clamp negative eigenvalues to zero (can happen with noisy distances)
     top2_vals = np.maximum(top2_vals, 0.0)
@@ -46,6 +41,57 @@ def mds_positions(distances: np.ndarray) -> np.ndarray:
     return positions
 
 
+# Below this size the full O(n^3) eigendecomposition is cheaper than iterating.
+_FULL_EIGH_MAX_N = 8
+
+
+def _top2_eigenpairs(B: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """Two largest eigenpairs of a symmetric matrix.
+
+    Small matrices use the exact eigendecomposition; larger ones use a seeded
+    randomized subspace iteration, which only needs O(n^2) work per sweep to
+    recover the rank-2 embedding MDS keeps.
+    """
+    n = B.shape[0]
+    if n <= _FULL_EIGH_MAX_N:
+        eigenvalues, eigenvectors = np.linalg.eigh(B)
+        idx = np.argsort(eigenvalues)[::-1]
+        return eigenvalues[idx[:2]], eigenvectors[:, idx[:2]]
+
+    rng = np.random.default_rng(0)
+    basis = rng.standard_normal((n, 2))
+    for _ in range(8):
+        basis, _ = np.linalg.qr(B @ basis)
+    projected = basis.T @ B @ basis
+    small_vals, small_vecs = np.linalg.eigh(projected)
+    idx = np.argsort(small_vals)[::-1]
+    return small_vals[idx], (basis @ small_vecs)[:, idx]
+
+
+# Golden angle spreads successive points evenly without clustering.
+_GOLDEN_ANGLE = np.pi * (3.0 - np.sqrt(5.0))
+
+
+def landmark_mds(landmark_distances: np.ndarray) -> np.ndarray:
+    """Place points around a single landmark from one row of distances.
+
+    When only landmark->point distances exist (pure RSSI ranging), the full
+    distance matrix is analytic and carries no extra information, so skip the
+    n x n materialization and MDS entirely: put the landmark at the origin and
+    fan the other points out at golden-angle increments at their measured
+    distances. Returns an Nx2 array with the landmark at row 0.
+    """
+    n = landmark_distances.shape[0]
+    positions = np.zeros((n, 2))
+    if n <= 1:
+        return positions
+    angles = _GOLDEN_ANGLE * np.arange(n - 1)
+    d = landmark_distances[1:]
+    positions[1:, 0] = d * np.cos(angles)
+    positions[1:, 1] = d * np.sin(angles)
+    return positions
+
+
 def anchor_positions(
     positions: np.ndarray,
     anchors: dict[int, tuple[float, float]],
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 
 import numpy as np
@@ -156,11 +157,11 @@ _DOORWAY_THRESHOLD = 3
 
 def update_topology(
     graph: RoomGraph,
-    motion_events: list[tuple[str, str, float]],
+    motion_events: Iterable[tuple[str, str, float]],
 ) -> RoomGraph:
     """Update room connectivity based on observed motion events.
 
-    motion_events: list of (from_zone, to_zone, timestamp).
+    motion_events: iterable of (from_zone, to_zone, timestamp).
     Frequently traversed zone pairs get a doorway connection added.
     """
     # Count traversals between zone pairs
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import asyncio
+import functools
 import hashlib
 import time
 from dataclasses import dataclass
@@ -62,16 +63,54 @@ def generate_chirp(
     return np.sin(phase).astype(np.float32)
 
 
+@functools.lru_cache(maxsize=32)
+def _template_rfft(template_bytes: bytes, fft_size: int) -> np.ndarray:
+    """Conjugated spectrum of the L2-normalized template at fft_size.
+
+    Chirps are deterministic per (channel, duration) and record lengths are
+    stable, so the template-side FFT repeats across pings; caching it leaves
+    one forward and one inverse FFT per correlation.
+    """
+    template = np.frombuffer(template_bytes, dtype=np.float32)
+    template_norm = template / (np.linalg.norm(template) + 1e-12)
+    spectrum = np.conj(np.fft.rfft(template_norm, fft_size))
+    spectrum.flags.writeable = False
+    return spectrum
+
+
+@functools.lru_cache(maxsize=64)
+def cached_chirp(
+    freq_start: int | None = None,
+    freq_end: int | None = None,
+    duration: float = DEFAULT_CHIRP_DURATION,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+) -> np.ndarray:
+    """Memoized generate_chirp for the per-cycle/per-peer templates.
+
+    Parameters repeat every acoustic cycle, so the phase integral and sin()
+    over the whole buffer run once per distinct chirp. The cached array is
+    read-only so callers cannot corrupt it in place.
+    """
+    chirp = generate_chirp(
+        freq_start=freq_start,
+        freq_end=freq_end,
+        duration=duration,
+        sample_rate=sample_rate,
+    )
+    chirp.flags.writeable = False
+    return chirp
+
+
 def matched_filter(received: np.ndarray, template: np.ndarray) -> np.ndarray:
     """Cross-correlate received signal with chirp template. Returns correlation envelope."""
-    # Normalize template
-    template_norm = template / (np.linalg.norm(template) + 1e-12)
-    # Full cross-correlation via FFT
-    n = len(received) + len(template_norm) - 1
+    # Full cross-correlation via FFT; the template spectrum comes from cache.
+    n = len(received) + len(template) - 1
     fft_size = 1 << (n - 1).bit_length()  # next power of 2
+    T_conj = _template_rfft(
+        np.ascontiguousarray(template, dtype=np.float32).tobytes(), fft_size
+    )
     R = np.fft.rfft(received, fft_size)
-    T = np.fft.rfft(template_norm, fft_size)
-    corr = np.fft.irfft(R * np.conj(T), fft_size)
+    corr = np.fft.irfft(R * T_conj, fft_size)
     return np.abs(corr[:n])
 
 
@@ -214,22 +253,22 @@ async def play_chirp(
     return True
 
 
-async def listen_for_chirp(
-    chirp: np.ndarray | None = None,
+async def record_audio(
     sample_rate: int = DEFAULT_SAMPLE_RATE,
     record_duration: float = 0.5,
-    template_length: int | None = None,
-) -> ListenResult | None:
-    """Record audio and detect chirp arrival via matched filter."""
+) -> tuple[np.ndarray, float] | None:
+    """Record from the microphone without detection.
+
+    Returns (samples, record_started_at) where the timestamp is loop time,
+    or None if sounddevice is unavailable. sounddevice's convenience
+    functions share one global stream, so callers wanting to detect several
+    chirps should record once and matched-filter per template rather than
+    recording concurrently.
+    """
     sd = _try_import_sounddevice()
     if sd is None:
         return None
 
-    if chirp is None:
-        chirp = generate_chirp(sample_rate=sample_rate)
-    if template_length is None:
-        template_length = 0
-
     n_record = int(record_duration * sample_rate)
     loop = asyncio.get_running_loop()
     record_started_at = loop.time()
@@ -243,13 +282,46 @@ async def listen_for_chirp(
             blocking=True,
         ),
     )
-    recorded = recorded.flatten()
+    return recorded.flatten(), record_started_at
+
+
+def detect_chirp(
+    recorded: np.ndarray,
+    chirp: np.ndarray,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    template_length: int = 0,
+) -> tuple[float | None, float]:
+    """Matched-filter a recording against one chirp template.
+
+    Returns (tof_within_recording, peak_snr); tof is None without a clear peak.
+    """
     corr = matched_filter(recorded, chirp)
     tof = find_peak_tof(corr, sample_rate, template_length=template_length)
 
     noise_floor = float(np.median(np.abs(corr))) + 1e-12
     peak_val = float(np.max(np.abs(corr))) if len(corr) else 0.0
-    peak_snr = peak_val / noise_floor
+    return tof, peak_val / noise_floor
+
+
+async def listen_for_chirp(
+    chirp: np.ndarray | None = None,
+    sample_rate: int = DEFAULT_SAMPLE_RATE,
+    record_duration: float = 0.5,
+    template_length: int | None = None,
+) -> ListenResult | None:
+    """Record audio and detect chirp arrival via matched filter."""
+    if chirp is None:
+        chirp = generate_chirp(sample_rate=sample_rate)
+    if template_length is None:
+        template_length = 0
+
+    recording = await record_audio(sample_rate=sample_rate, record_duration=record_duration)
+    if recording is None:
+        return None
+    recorded, record_started_at = recording
+    tof, peak_snr = detect_chirp(
+        recorded, chirp, sample_rate, template_length=template_length
+    )
 
     return ListenResult(
         tof=tof,
@@ -4,6 +4,10 @@ from __future__ import annotations
 
 import numpy as np
 
+# Randomized BLE addresses and passing devices mint new signal paths forever;
+# cap tracked filter state so long-running nodes stay O(cap), not O(lifetime).
+_MAX_TRACKED = 4096
+
 
 class KalmanFilter1D:
     """1D RSSI Kalman filter with constant-velocity state.
@@ -101,7 +105,13 @@ class KalmanFilter1D:
 
 
 class FilterBank:
-    """Collection of Kalman filters keyed by (source_id, target_id)."""
+    """Batched Kalman filters keyed by (source_id, target_id).
+
+    States and covariances live in contiguous arrays indexed by a key->row
+    dict, so a whole scan cycle updates in a handful of vectorized passes
+    instead of one small-matrix filter per observation. The math mirrors
+    KalmanFilter1D.update exactly, including the adaptive Q boost.
+    """
 
     def __init__(
         self,
@@ -109,25 +119,158 @@ class FilterBank:
         measurement_noise: float = 4.0,
         dt: float = 1.0,
     ) -> None:
-        self._filters: dict[tuple[str, str], KalmanFilter1D] = {}
-        self._process_noise = process_noise
-        self._measurement_noise = measurement_noise
-        self._dt = dt
+        self._dt = max(float(dt), 1e-3)
+        self._measurement_noise = float(measurement_noise)
+        self._adaptive_threshold = 3.0
+        self._scaling_factor = 100.0
 
-    def update(self, source_id: str, target_id: str, rssi: float) -> tuple[float, float]:
-        key = (source_id, target_id)
-        if key not in self._filters:
-            self._filters[key] = KalmanFilter1D(
-                process_noise=self._process_noise,
-                measurement_noise=self._measurement_noise,
-                dt=self._dt,
+        dt2 = self._dt * self._dt
+        dt3 = dt2 * self._dt
+        dt4 = dt3 * self._dt
+        q = float(max(process_noise, 1e-6))
+        self._F = np.array([[1.0, self._dt], [0.0, 1.0]], dtype=np.float64)
+        self._base_Q = q * np.array(
+            [[dt4 / 4.0, dt3 / 2.0], [dt3 / 2.0, dt2]],
+            dtype=np.float64,
+        )
+
+        self._rows: dict[tuple[str, str], int] = {}
+        self._x = np.zeros((0, 2), dtype=np.float64)
+        self._P = np.zeros((0, 2, 2), dtype=np.float64)
+        self._initialized = np.zeros(0, dtype=bool)
+        self._last_used = np.zeros(0, dtype=np.int64)
+        self._tick = 0
+
+    def _evict_lru(self) -> None:
+        """Drop the least-recently-updated quarter of rows and compact."""
+        n = len(self._rows)
+        drop_count = n - ((_MAX_TRACKED * 3) // 4)
+        if drop_count <= 0:
+            return
+        order = np.argsort(self._last_used[:n])
+        keep_mask = np.ones(n, dtype=bool)
+        keep_mask[order[:drop_count]] = False
+        remap = np.cumsum(keep_mask) - 1
+        self._rows = {
+            key: int(remap[row]) for key, row in self._rows.items() if keep_mask[row]
+        }
+        self._x = self._x[:n][keep_mask].copy()
+        self._P = self._P[:n][keep_mask].copy()
+        self._initialized = self._initialized[:n][keep_mask].copy()
+        self._last_used = self._last_used[:n][keep_mask].copy()
+
+    def _rows_for(self, source_id: str, target_ids: list[str]) -> np.ndarray:
+        indices = np.empty(len(target_ids), dtype=np.intp)
+        for i, target_id in enumerate(target_ids):
+            key = (source_id, target_id)
+            row = self._rows.get(key)
+            if row is None:
+                row = len(self._rows)
+                self._rows[key] = row
+                if row >= self._x.shape[0]:
+                    grow = max(16, self._x.shape[0])
+                    self._x = np.vstack([self._x, np.zeros((grow, 2))])
+                    new_P = np.zeros((grow, 2, 2))
+                    new_P[:] = np.eye(2) * 100.0
+                    self._P = np.concatenate([self._P, new_P])
+                    self._initialized = np.concatenate(
+                        [self._initialized, np.zeros(grow, dtype=bool)]
+                    )
+                    self._last_used = np.concatenate(
+                        [self._last_used, np.zeros(grow, dtype=np.int64)]
+                    )
+            indices[i] = row
+        self._tick += 1
+        self._last_used[indices] = self._tick
+        return indices
+
+    def update_batch(
+        self,
+        source_id: str,
+        target_ids: list[str],
+        measurements: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Update every (source_id, target_id) path with its measurement.
+
+        Returns (filtered_rssi, innovation) arrays aligned with target_ids.
+        """
+        if len(target_ids) != len(set(target_ids)):
+            # Duplicate paths in one batch must see each other's updates;
+            # fall back to sequential singles for that rare case.
+            filtered = np.empty(len(target_ids))
+            innovations = np.empty(len(target_ids))
+            for i, (target_id, z) in enumerate(zip(target_ids, measurements)):
+                f, y = self.update_batch(source_id, [target_id], np.array([z]))
+                filtered[i], innovations[i] = f[0], y[0]
+            return filtered, innovations
+
+        # Evict between batches only, so row indices handed out below stay
+        # valid for the whole update. The cap is soft by one batch width.
+        if len(self._rows) + len(target_ids) > _MAX_TRACKED:
+            self._evict_lru()
+        rows = self._rows_for(source_id, target_ids)
+        z = np.asarray(measurements, dtype=np.float64)
+        x = self._x[rows]
+        P = self._P[rows]
+        live = self._initialized[rows]
+
+        filtered = z.copy()
+        innovations = np.zeros_like(z)
+
+        # First sighting: seed the state with the measurement.
+        if not live.all():
+            seed_rows = rows[~live]
+            self._x[seed_rows, 0] = z[~live]
+            self._x[seed_rows, 1] = 0.0
+            self._initialized[seed_rows] = True
+
+        if live.any():
+            idx = np.flatnonzero(live)
+            xl, Pl, zl = x[idx], P[idx], z[idx]
+            F, Q, R = self._F, self._base_Q, self._measurement_noise
+
+            # 1. Innovation under the standard prediction.
+            x_pred = xl @ F.T
+            P_pred = np.einsum("ij,njk,lk->nil", F, Pl, F) + Q
+            y1 = zl - x_pred[:, 0]
+            S1 = P_pred[:, 0, 0] + R
+            z_score = np.abs(y1) / np.sqrt(np.maximum(S1, 1e-12))
+
+            # 2. Boost Q where a jump is detected so the filter catches up.
+            q_scale = np.where(z_score > self._adaptive_threshold, self._scaling_factor, 1.0)
+            P_pred = np.einsum("ij,njk,lk->nil", F, Pl, F) + Q * q_scale[:, None, None]
+
+            # 3. Measurement update with H = [1, 0].
+            y = zl - x_pred[:, 0]
+            S = P_pred[:, 0, 0] + R
+            K = P_pred[:, :, 0] / S[:, None]
+            x_new = x_pred + K * y[:, None]
+            # Joseph form: guarantees P stays symmetric positive-definite
+            IKH = np.zeros((idx.size, 2, 2))
+            IKH[:, 0, 0] = 1.0 - K[:, 0]
+            IKH[:, 1, 0] = -K[:, 1]
+            IKH[:, 1, 1] = 1.0
+            P_new = np.einsum("nij,njk,nlk->nil", IKH, P_pred, IKH) + R * (
+                K[:, :, None] * K[:, None, :]
             )
-        return self._filters[key].update(rssi)
+
+            live_rows = rows[idx]
+            self._x[live_rows] = x_new
+            self._P[live_rows] = P_new
+            filtered[idx] = x_new[:, 0]
+            innovations[idx] = y
+
+        return filtered, innovations
+
+    def update(self, source_id: str, target_id: str, rssi: float) -> tuple[float, float]:
+        filtered, innovations = self.update_batch(
+            source_id, [target_id], np.array([rssi], dtype=np.float64)
+        )
+        return float(filtered[0]), float(innovations[0])
 
     def get_state(self, source_id: str, target_id: str) -> tuple[float, float] | None:
         """Return (filtered_rssi, rssi_rate) for a signal path, or None if unseen."""
-        key = (source_id, target_id)
-        kf = self._filters.get(key)
-        if kf is None or not kf._initialized:
+        row = self._rows.get((source_id, target_id))
+        if row is None or not self._initialized[row]:
             return None
-        return (float(kf.x[0]), float(kf.x[1]))
+        return (float(self._x[row, 0]), float(self._x[row, 1]))
@@ -5,6 +5,8 @@ from __future__ import annotations
 import math
 from dataclasses import dataclass
 
+import numpy as np
+
 from senseye.node.belief import Belief, DeviceState, LinkState, ZoneBelief
 from senseye.node.scanner import Observation, SignalType
 
@@ -16,9 +18,52 @@ class ZoneConfig:
     links: list[tuple[str, str]]
 
 
-# RSSI history buffer: device_id -> list of recent raw RSSI values.
+class RssiRing:
+    """Fixed-capacity ring buffer of raw RSSI samples.
+
+    O(1) append into a preallocated array instead of list append + trim;
+    memory per device is bounded by construction.
+    """
+
+    __slots__ = ("buf", "idx", "count")
+
+    def __init__(self, capacity: int) -> None:
+        self.buf = np.empty(max(int(capacity), 1), dtype=np.float64)
+        self.idx = 0
+        self.count = 0
+
+    def append(self, value: float) -> None:
+        self.buf[self.idx] = value
+        self.idx = (self.idx + 1) % self.buf.shape[0]
+        self.count = min(self.count + 1, self.buf.shape[0])
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __iter__(self):
+        return iter(self.tail(self.count).tolist())
+
+    @property
+    def last(self) -> float:
+        """Most recent sample (undefined before the first append)."""
+        return float(self.buf[self.idx - 1])
+
+    def tail(self, window: int) -> np.ndarray:
+        """The last `window` samples, oldest first.
+
+        A negative start slices from the array's end, which is exactly the
+        wrapped oldest segment, so no index arithmetic beyond the subtraction.
+        """
+        k = min(window, self.count)
+        start = self.idx - k
+        if start >= 0:
+            return self.buf[start:self.idx]
+        return np.concatenate((self.buf[start:], self.buf[: self.idx]))
+
+
+# RSSI history: device_id -> ring of recent raw RSSI values.
 # Used for variance-based motion detection (separate from Kalman filtering).
-RssiHistory = dict[str, list[float]]
+RssiHistory = dict[str, RssiRing]
 _MAX_RF_DISTANCE_M = 40.0
 _MIN_RF_DISTANCE_M = 0.2
 
@@ -27,13 +72,12 @@ PATHLOSS_N = 2.5   # path-loss exponent
 PATHLOSS_A = 45.0  # 1-meter intercept (dBm magnitude)
 
 
-def _rssi_variance(samples: list[float], window: int = 10) -> float:
+def _rssi_variance(ring: RssiRing, window: int = 10) -> float:
     """Variance of the last `window` samples."""
-    tail = samples[-window:]
-    if len(tail) < 2:
+    tail = ring.tail(window)
+    if tail.size < 2:
         return 0.0
-    mean = sum(tail) / len(tail)
-    return sum((x - mean) ** 2 for x in tail) / len(tail)
+    return float(tail.var())
 
 
 def _free_space_rssi(distance: float, n: float = PATHLOSS_N, a: float = PATHLOSS_A) -> float:
@@ -57,6 +101,28 @@ def _rssi_to_distance(rssi: float, n: float = PATHLOSS_N, a: float = PATHLOSS_A)
     return min(max(distance, _MIN_RF_DISTANCE_M), _MAX_RF_DISTANCE_M)
 
 
+def expected_rssi_map(
+    node_positions: dict[str, tuple[float, float]],
+    my_node_id: str,
+) -> dict[str, float]:
+    """Expected free-space RSSI from this node to each positioned peer.
+
+    Node positions only change when the floorplan does, so callers can build
+    this once per floorplan and spare infer() a sqrt+log10 per link per cycle.
+    """
+    my_pos = node_positions.get(my_node_id)
+    if my_pos is None:
+        return {}
+    expected: dict[str, float] = {}
+    for peer_id, (px, py) in node_positions.items():
+        if peer_id == my_node_id:
+            continue
+        dist = math.sqrt((px - my_pos[0]) ** 2 + (py - my_pos[1]) ** 2)
+        if dist > 0:
+            expected[peer_id] = _free_space_rssi(dist)
+    return expected
+
+
 def _raw_rssi_sample(obs: Observation) -> float:
     raw = obs.metadata.get("raw_rssi")
     if isinstance(raw, int | float):
@@ -97,60 +163,72 @@ def infer(
     motion_window: int = 10,
     motion_threshold: float = 2.0,
     history_limit: int = 120,
+    max_devices: int = 4096,
+    expected_rssi: dict[str, float] | None = None,
 ) -> Belief:
     """Produce a Belief from current observations and accumulated filter state.
 
     Args:
         observations: latest scan results
-        rssi_history: device_id -> list of recent RSSI values (caller maintains)
+        rssi_history: device_id -> ring of recent RSSI values (caller maintains)
         node_positions: known (x,y) positions of fixed nodes, keyed by node_id
         zone_config: zone definitions for zone-level inference
         my_node_id: this node's ID (used as Belief.node_id)
         motion_window: sliding window size for variance calculation
         motion_threshold: variance threshold (dB^2) for motion detection
-        history_limit: max history length retained per device
+        history_limit: ring capacity per device (fixed at first sighting)
+        max_devices: max distinct devices retained in rssi_history (LRU)
+        expected_rssi: precomputed expected_rssi_map; rebuilt here if omitted
     """
     if node_positions is None:
         node_positions = {}
+    if expected_rssi is None:
+        expected_rssi = expected_rssi_map(node_positions, my_node_id)
 
     # Motion should track raw RSSI variance, while attenuation and distance
     # should use the latest filtered RSSI.
     current_rssi_by_device: dict[str, float] = {}
     latest_observation_by_device: dict[str, Observation] = {}
     for obs in observations:
-        fb = rssi_history.setdefault(obs.device_id, [])
-        fb.append(_raw_rssi_sample(obs))
-        if len(fb) > history_limit:
-            del fb[:-history_limit]
+        ring = rssi_history.get(obs.device_id)
+        if ring is None:
+            ring = rssi_history[obs.device_id] = RssiRing(history_limit)
+        else:
+            # Re-insert so dict order doubles as recency order for eviction.
+            rssi_history[obs.device_id] = rssi_history.pop(obs.device_id)
+        ring.append(_raw_rssi_sample(obs))
         current_rssi_by_device[obs.device_id] = obs.rssi
         latest_observation_by_device[obs.device_id] = obs
 
+    # Randomized addresses accumulate forever otherwise; drop the least
+    # recently seen devices once over the cap.
+    while len(rssi_history) > max_devices:
+        del rssi_history[next(iter(rssi_history))]
+
     # --- Per-link inference ---
     links: dict[str, LinkState] = {}
     devices: dict[str, DeviceState] = {}
 
-    for device_id, samples in rssi_history.items():
-        if not samples:
+    for device_id, ring in rssi_history.items():
+        if not len(ring):
             continue
 
         # Motion: high variance in recent samples
-        var = _rssi_variance(samples, motion_window)
+        var = _rssi_variance(ring, motion_window)
         has_motion = var > motion_threshold
 
         # Use filtered RSSI when available this cycle, otherwise last sample.
-        current_rssi = current_rssi_by_device.get(device_id, samples[-1])
+        current_rssi = current_rssi_by_device.get(device_id)
+        if current_rssi is None:
+            current_rssi = ring.last
         latest_observation = latest_observation_by_device.get(device_id)
         is_acoustic = (
             latest_observation is not None
             and latest_observation.signal_type == SignalType.ACOUSTIC
         )
-        base_confidence = _sample_confidence(len(samples), motion_window)
+        base_confidence = _sample_confidence(len(ring), motion_window)
         confidence = base_confidence * _innovation_penalty(latest_observation)
 
-        # Attenuation: compare to free-space model if we know positions
-        my_pos = node_positions.get(my_node_id)
-        peer_pos = node_positions.get(device_id)
-
         if is_acoustic:
             confidence = _acoustic_confidence(latest_observation, base_confidence)
             links[device_id] = LinkState(
@@ -158,26 +236,14 @@ def infer(
                 motion=has_motion,
                 confidence=confidence,
             )
-        elif my_pos is not None and peer_pos is not None:
-            dx = my_pos[0] - peer_pos[0]
-            dy = my_pos[1] - peer_pos[1]
-            dist = math.sqrt(dx * dx + dy * dy)
-            if dist > 0:
-                expected = _free_space_rssi(dist)
-                # Excess attenuation: how much weaker than free-space
-                attenuation = expected - current_rssi
-            else:
-                attenuation = 0.0
-
-            links[device_id] = LinkState(
-                attenuation=max(attenuation, 0.0),
-                motion=has_motion,
-                confidence=confidence,
-            )
         else:
-            # No position info: still record link with zero attenuation
+            # Excess attenuation vs the free-space model, when both
+            # positions are known; zero otherwise (link still recorded).
+            expected = expected_rssi.get(device_id)
             links[device_id] = LinkState(
-                attenuation=0.0,
+                attenuation=(
+                    max(expected - current_rssi, 0.0) if expected is not None else 0.0
+                ),
                 motion=has_motion,
                 confidence=confidence,
             )
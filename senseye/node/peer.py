@@ -11,7 +11,7 @@ from zeroconf import IPVersion, ServiceInfo, ServiceStateChange, Zeroconf
 from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo, AsyncZeroconf
 
 from senseye.node.belief import Belief
-from senseye.protocol import MessageReader, MessageWriter
+from senseye.protocol import MessageReader, MessageWriter, encode
 
 log = logging.getLogger(__name__)
 
@@ -45,6 +45,10 @@ class PeerMesh:
         # Lock to protect _peers mutations
         self._lock = asyncio.Lock()
 
+        # Total payload bytes written to peers; the sense loop samples this
+        # to detect Wi-Fi backbone contention and throttle BLE scanning.
+        self._bytes_sent = 0
+
         self._server: asyncio.Server | None = None
         self._azc: AsyncZeroconf | None = None
         self._browser: AsyncServiceBrowser | None = None
@@ -120,13 +124,16 @@ class PeerMesh:
         self._acoustic_ping_callbacks.append(callback)
 
     async def broadcast_belief(self, belief: Belief) -> None:
-        msg = {"type": "belief", **belief.to_dict()}
+        # One encode shared by every peer; write_message would re-serialize
+        # the identical dict per connection.
+        payload = encode({"type": "belief", **belief.to_dict()})
         async with self._lock:
             peers = list(self._peers.items())
         failed: list[str] = []
         for peer_id, (_, _, _, mw) in peers:
             try:
-                await mw.write_message(msg)
+                await mw.write_encoded(payload)
+                self._bytes_sent += len(payload)
             except (ConnectionError, OSError):
                 log.debug("failed to send belief to %s", peer_id)
                 failed.append(peer_id)
@@ -136,6 +143,11 @@ class PeerMesh:
     def get_peers(self) -> list[str]:
         return list(self._peers.keys())
 
+    @property
+    def bytes_sent(self) -> int:
+        """Total payload bytes written to peers since startup."""
+        return self._bytes_sent
+
     async def request_acoustic_ping(
         self,
         peer_id: str,
@@ -395,8 +407,10 @@ class PeerMesh:
         if peer is None:
             return False
         _, _, _, writer = peer
+        payload = encode(message)
         try:
-            await writer.write_message(message)
+            await writer.write_encoded(payload)
+            self._bytes_sent += len(payload)
             return True
         except (ConnectionError, OSError):
             await self._disconnect_peer(peer_id)
@@ -68,6 +68,12 @@ class MessageWriter:
         self._writer.write(encode(message))
         await self._writer.drain()
 
+    async def write_encoded(self, payload: bytes) -> None:
+        """Write an already-encoded message (see encode); lets broadcast
+        callers serialize once and reuse the bytes across peers."""
+        self._writer.write(payload)
+        await self._writer.drain()
+
     def close(self) -> None:
         self._writer.close()
 
@@ -12,11 +12,34 @@ from rich.live import Live
 from rich.panel import Panel
 from rich.text import Text
 
+from senseye.mapping.dynamic.motion import MotionState
 from senseye.mapping.dynamic.state import WorldState
 from senseye.ui.overlay import compose
 from senseye.ui.renderer import RenderedMap, render_floorplan, render_no_map
 
 
+def _snapshot(state: WorldState) -> WorldState:
+    """Shallow-copy the dicts the layout iterates.
+
+    _build_layout runs on an executor thread while the sense loop keeps
+    mutating the live WorldState on the event loop; copying nodes, devices
+    and zone motion here (on the loop thread) keeps the worker from
+    iterating a dict mid-insert.
+    """
+    return WorldState(
+        floorplan=state.floorplan,
+        motion=MotionState(
+            zone_motion=dict(state.motion.zone_motion),
+            last_updated=dict(state.motion.last_updated),
+        ),
+        devices=dict(state.devices),
+        nodes=dict(state.nodes),
+        map_age=state.map_age,
+        timestamp=state.timestamp,
+        gen=state.gen,
+    )
+
+
 def _header(state: WorldState) -> Panel:
     """Build the header panel: title + time + node count."""
     now = time.strftime("%H:%M:%S")
@@ -169,6 +192,7 @@ class Dashboard:
         """Consume a WorldState async iterator and update the live display."""
         # Start with an empty state
         current_state = WorldState()
+        loop = asyncio.get_running_loop()
 
         with Live(self._build_layout(current_state), refresh_per_second=2) as live:
             quit_event = asyncio.Event()
@@ -202,7 +226,17 @@ class Dashboard:
                     if quit_event.is_set():
                         break
                     current_state = state
-                    live.update(self._build_layout(current_state))
+                    # Layout construction (map render + rich markup) is pure
+                    # CPU; build it off the event loop so a slow frame cannot
+                    # delay the sense cycle sharing this loop. The worker gets
+                    # a snapshot taken here, on the loop thread, so concurrent
+                    # sense-loop updates cannot resize the dicts it iterates.
+                    # Live repaints from its own refresh thread, so update()
+                    # is cheap.
+                    layout = await loop.run_in_executor(
+                        None, self._build_layout, _snapshot(current_state)
+                    )
+                    live.update(layout)
             finally:
                 quit_event.set()
                 quit_task.cancel()
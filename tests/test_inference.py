@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from senseye.node.inference import infer
+from senseye.node.inference import RssiHistory, infer
 from senseye.node.scanner import Observation, SignalType
 
 
@@ -15,19 +15,19 @@ def _observation(rssi: float, raw_rssi: float) -> Observation:
 
 
 def test_infer_uses_raw_history_and_filtered_current_rssi() -> None:
-    history: dict[str, list[float]] = {}
+    history: RssiHistory = {}
     belief = infer(
         observations=[_observation(rssi=-60.0, raw_rssi=-50.0)],
         rssi_history=history,
         my_node_id="node-a",
     )
 
-    assert history["device-1"][-1] == -50.0
+    assert history["device-1"].last == -50.0
     assert belief.devices["device-1"].rssi == -60.0
 
 
 def test_infer_caps_rssi_history() -> None:
-    history: dict[str, list[float]] = {}
+    history: RssiHistory = {}
     for idx in range(20):
         infer(
             observations=[_observation(rssi=float(idx), raw_rssi=float(idx))],
@@ -36,11 +36,11 @@ def test_infer_caps_rssi_history() -> None:
             history_limit=5,
         )
 
-    assert history["device-1"] == [15.0, 16.0, 17.0, 18.0, 19.0]
+    assert list(history["device-1"]) == [15.0, 16.0, 17.0, 18.0, 19.0]
 
 
 def test_infer_uses_acoustic_distance_metadata() -> None:
-    history: dict[str, list[float]] = {}
+    history: RssiHistory = {}
     belief = infer(
         observations=[
             Observation(